@@ -7,25 +7,12 @@ from utils.css_loader import load_custom_styles
 from utils.config import Config
 from utils.session import SessionManager
 from services.manga_service import MangaService
-from services.image_service import ImageService
+from services.image_service import ImageService, cloudinary_installed
 from services.special_volume_service import SpecialVolumeService
-from components.delete_dialog import DeleteDialog
 
-# ビューモジュールをインポート
-from views.home import show_books_home
-from views.detail import show_book_detail
-from views.add import show_add_book
-from views.edit import show_edit_book
-from views.add_special_volume import show_add_special_volume
-from views.special_volume_detail import show_special_volume_detail
-
-# Cloudinaryのインポート
-try:
-    import cloudinary
-    import cloudinary.uploader
-    CLOUDINARY_AVAILABLE = True
-except ImportError:
-    CLOUDINARY_AVAILABLE = False
+# Cloudinaryは存在確認のみ行い、実際のインポートは初回アップロード時まで遅延する
+# （app.pyは再実行ごとに評価されるため、確認結果はキャッシュしたものを使う）
+CLOUDINARY_AVAILABLE = cloudinary_installed()
 
 # =========================
 # アプリケーション設定
@@ -49,18 +36,8 @@ SPECIAL_VOLUMES_DATABASE_ID = notion_config["special_volumes_database_id"]
 # Cloudinary 設定
 # =========================
 cloudinary_config = Config.load_cloudinary_config()
-if CLOUDINARY_AVAILABLE and cloudinary_config:
-    try:
-        cloudinary.config(
-            cloud_name=cloudinary_config["cloud_name"],
-            api_key=cloudinary_config["api_key"],
-            api_secret=cloudinary_config["api_secret"]
-        )
-        CLOUDINARY_ENABLED = True
-    except Exception:
-        CLOUDINARY_ENABLED = False
-else:
-    CLOUDINARY_ENABLED = False
+# ライブラリと設定の両方が揃っている場合のみ有効（画面側はこのフラグのみを参照する）
+CLOUDINARY_ENABLED = CLOUDINARY_AVAILABLE and bool(cloudinary_config)
 
 # =========================
 # セッション状態の初期化
@@ -70,9 +47,27 @@ SessionManager.initialize()
 # =========================
 # サービス層の初期化
 # =========================
-manga_service = MangaService(NOTION_API_KEY, BOOKS_DATABASE_ID)
-image_service = ImageService(CLOUDINARY_AVAILABLE, CLOUDINARY_ENABLED)
-special_volume_service = SpecialVolumeService(NOTION_API_KEY, SPECIAL_VOLUMES_DATABASE_ID)
+# サービスはセッション固有の状態を持たないため、プロセス内で一度だけ生成して使い回す
+# （ユーザーごとの状態はSessionManager経由でst.session_stateに保持する）
+@st.cache_resource(show_spinner=False)
+def _create_manga_service(api_key: str, database_id: str) -> MangaService:
+    return MangaService(api_key, database_id)
+
+
+@st.cache_resource(show_spinner=False)
+def _create_image_service(cloudinary_available: bool, cloudinary_enabled: bool, _cloudinary_config) -> ImageService:
+    # 設定はConfigでプロセス内キャッシュ済みのため、キャッシュキーには含めない
+    return ImageService(cloudinary_available, cloudinary_enabled, _cloudinary_config)
+
+
+@st.cache_resource(show_spinner=False)
+def _create_special_volume_service(api_key: str, database_id: str) -> SpecialVolumeService:
+    return SpecialVolumeService(api_key, database_id)
+
+
+manga_service = _create_manga_service(NOTION_API_KEY, BOOKS_DATABASE_ID)
+image_service = _create_image_service(CLOUDINARY_AVAILABLE, CLOUDINARY_ENABLED, cloudinary_config)
+special_volume_service = _create_special_volume_service(NOTION_API_KEY, SPECIAL_VOLUMES_DATABASE_ID)
 
 # =========================
 # ページ遷移関数（SessionManagerから取得）
@@ -91,8 +86,79 @@ go_to_add_special_volume = SessionManager.go_to_add_special_volume
 @st.dialog("削除確認")
 def confirm_delete_dialog():
     """削除確認ダイアログ（DeleteDialogコンポーネント使用）"""
+    from components.delete_dialog import DeleteDialog
     book = st.session_state.selected_book
-    DeleteDialog.show(book, manga_service, image_service, go_to_home)
+    DeleteDialog.show(book, manga_service, image_service, go_to_home, special_volume_service)
+
+
+# =========================
+# ページ描画関数（ビューは表示時に遅延インポート）
+# =========================
+def _render_home():
+    from views.home import show_books_home
+    show_books_home(
+        manga_service=manga_service,
+        notion_api_key=NOTION_API_KEY,
+        books_database_id=BOOKS_DATABASE_ID,
+        go_to_detail=go_to_detail,
+        special_volume_service=special_volume_service
+    )
+
+
+def _render_detail():
+    from views.detail import show_book_detail
+    show_book_detail(special_volume_service, on_delete=confirm_delete_dialog)
+
+
+def _render_add_book():
+    from views.add import show_add_book
+    show_add_book(
+        manga_service=manga_service,
+        image_service=image_service,
+        go_to_home=go_to_home,
+        notion_api_key=NOTION_API_KEY,
+        books_database_id=BOOKS_DATABASE_ID,
+        cloudinary_enabled=CLOUDINARY_ENABLED
+    )
+
+
+def _render_edit_book():
+    from views.edit import show_edit_book
+    show_edit_book(
+        manga_service=manga_service,
+        image_service=image_service,
+        go_to_home=go_to_home,
+        cloudinary_enabled=CLOUDINARY_ENABLED
+    )
+
+
+def _render_add_special_volume():
+    from views.add_special_volume import show_add_special_volume
+    show_add_special_volume(
+        special_volume_service=special_volume_service,
+        manga_service=manga_service,
+        image_service=image_service,
+        go_to_home=go_to_home
+    )
+
+
+def _render_special_volume_detail():
+    from views.special_volume_detail import show_special_volume_detail
+    show_special_volume_detail(
+        special_volume_service=special_volume_service,
+        manga_service=manga_service
+    )
+
+
+# ページ名 → 描画関数のルーティングテーブル
+ROUTES = {
+    "books_home": _render_home,
+    "book_detail": _render_detail,
+    "add_book": _render_add_book,
+    "edit_book": _render_edit_book,
+    "add_special_volume": _render_add_special_volume,
+    "special_volume_detail": _render_special_volume_detail,
+}
 
 
 # =========================
@@ -103,54 +169,16 @@ def main():
     # カスタムCSSを読み込み
     load_custom_styles()
     
-    # 現在のページに応じてルーティング
-    current_page = st.session_state.page
-    
-    if current_page == "books_home":
-        show_books_home(
-            manga_service=manga_service,
-            notion_api_key=NOTION_API_KEY,
-            books_database_id=BOOKS_DATABASE_ID,
-            go_to_detail=go_to_detail,
-            special_volume_service=special_volume_service
-        )
-    
-    elif current_page == "book_detail":
-        show_book_detail(special_volume_service)
-    
-    elif current_page == "add_book":
-        show_add_book(
-            manga_service=manga_service,
-            image_service=image_service,
-            go_to_home=go_to_home,
-            notion_api_key=NOTION_API_KEY,
-            books_database_id=BOOKS_DATABASE_ID,
-            cloudinary_available=CLOUDINARY_AVAILABLE,
-            cloudinary_enabled=CLOUDINARY_ENABLED
-        )
-    
-    elif current_page == "edit_book":
-        show_edit_book(
-            manga_service=manga_service,
-            image_service=image_service,
-            go_to_home=go_to_home,
-            cloudinary_available=CLOUDINARY_AVAILABLE,
-            cloudinary_enabled=CLOUDINARY_ENABLED
-        )
-    
-    elif current_page == "add_special_volume":
-        show_add_special_volume(
-            special_volume_service=special_volume_service,
-            manga_service=manga_service,
-            image_service=image_service,
-            go_to_home=go_to_home
-        )
+    # ?book=<ページID> で直接詳細画面を開く（ブックマーク・共有用）
+    book_id = st.query_params.get("book")
+    if book_id:
+        del st.query_params["book"]
+        book = manga_service.find_manga_by_id(book_id)
+        if book:
+            go_to_detail(book)
     
-    elif current_page == "special_volume_detail":
-        show_special_volume_detail(
-            special_volume_service=special_volume_service,
-            manga_service=manga_service
-        )
+    # 現在のページに応じてルーティング（未知のページ名はホームを表示）
+    ROUTES.get(st.session_state.page, _render_home)()
 
 
 if __name__ == "__main__":
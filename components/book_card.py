@@ -2,9 +2,44 @@
 BookCard Component: 漫画カード表示用コンポーネント
 """
 
-from typing import Optional
+import streamlit as st
+from typing import Dict, List, Optional
+from urllib.parse import quote
 from models.manga import Manga
-from config.constants import DEFAULT_IMAGE_URL
+from config.constants import MAGAZINE_TYPE_CLASSES, PLACEHOLDER_IMAGE_SVG
+from utils.image_url import thumbnail_url, lqip_url
+
+# 画像なしカード用のプレースホルダー（data URIとして埋め込む）
+_PLACEHOLDER_IMAGE = "data:image/svg+xml;charset=utf-8," + quote(PLACEHOLDER_IMAGE_SVG)
+
+# カード画像のHTMLテンプレート
+# 画面外の画像は読み込みを遅延し、デコードはメインスレッド外で行う
+# 本画像の読み込み完了までは背景にぼかしプレースホルダーを表示
+# （st.markdownではonload等のJSが動かないため、CSSの背景画像で重ねる）
+_IMAGE_HTML = '<img src="{src}" alt="{alt}" loading="lazy" decoding="async">'
+_LQIP_IMAGE_HTML = (
+    '<img src="{src}" alt="{alt}" loading="lazy" decoding="async"'
+    ' class="lqip" style="background-image:url(\'{placeholder}\')">'
+)
+_PLACEHOLDER_IMAGE_HTML = f'<img src="{_PLACEHOLDER_IMAGE}" alt="画像なし" decoding="async">'
+
+# 画面上部（最初の行）のカードは遅延読み込みせず、優先して取得させる
+_LAZY_LOADING_ATTR = ' loading="lazy"'
+_EAGER_LOADING_ATTR = ' fetchpriority="high"'
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _render_cards(mangas: List[Manga]) -> Dict[str, str]:
+    """
+    漫画一覧の全カードHTMLを生成（一覧データが変わらない限りキャッシュを再利用）
+    
+    Args:
+        mangas: 漫画オブジェクトのリスト
+    
+    Returns:
+        Dict[str, str]: 漫画ID → カード表示用のHTML文字列
+    """
+    return {manga.id: BookCard.render(manga) for manga in mangas}
 
 
 class BookCard:
@@ -55,46 +90,84 @@ class BookCard:
             media_info = f'<div class="book-media-info">💻 {manga.owned_media}</div>'
         
         # HTMLテンプレート
-        card_html = f"""
-        <div class="book-card">
-            <div class="mobile-book-image">
-                {image_html}
-            </div>
-            <div class="mobile-book-info">
-                <div class="status-container">
-                    <span class="status-badge {'status-completed' if is_completed else 'status-ongoing'}">{completion_status}</span>{unpurchased_badge}
-                </div>
-                {f'<div class="book-title-kana">{manga.title_kana}</div>' if manga.title_kana else ''}
-                <h3>{manga.title}</h3>
-                {magazine_type_info}
-                {magazine_info}
-                {volume_info}
-                {media_info}
-            </div>
-        </div>
+        # 空白・改行を含めず1行で組み立てる（送信量を減らし、空行でHTMLブロックが途切れるのを防ぐ）
+        status_class = 'status-completed' if is_completed else 'status-ongoing'
+        title_kana_info = f'<div class="book-title-kana">{manga.title_kana}</div>' if manga.title_kana else ''
+        card_html = (
+            f'<div class="book-card">'
+            f'<div class="mobile-book-image">{image_html}</div>'
+            f'<div class="mobile-book-info">'
+            f'<div class="status-container">'
+            f'<span class="status-badge {status_class}">{completion_status}</span>{unpurchased_badge}'
+            f'</div>'
+            f'{title_kana_info}'
+            f'<h3>{manga.title}</h3>'
+            f'{magazine_type_info}{magazine_info}{volume_info}{media_info}'
+            f'</div>'
+            f'</div>'
+        )
+        
+        return card_html
+    
+    @staticmethod
+    def render_all(mangas: List[Manga]) -> Dict[str, str]:
         """
+        漫画一覧のカードHTMLをまとめて取得
+        
+        フィルター・並び替えに関係なくキャッシュが効くよう、
+        絞り込み前の一覧を渡すこと
+        
+        Args:
+            mangas: 漫画オブジェクトのリスト（絞り込み前）
         
+        Returns:
+            Dict[str, str]: 漫画ID → カード表示用のHTML文字列
+        """
+        # セッションキャッシュの一覧は再実行をまたいで同じオブジェクトのため、
+        # 同一オブジェクトであればst.cache_dataの引数ハッシュ計算も省く
+        state = st.session_state
+        if state.get("card_html_source") is mangas:
+            return state.card_html
+        
+        card_html = _render_cards(mangas)
+        state.card_html_source = mangas
+        state.card_html = card_html
         return card_html
     
+    @staticmethod
+    def prioritize(card_html: str) -> str:
+        """
+        カードHTMLの画像を遅延読み込みせず優先取得するよう書き換え
+        
+        最初の行など、表示直後に画面内にあるカードに使用する
+        
+        Args:
+            card_html: render / render_all で生成したカードHTML
+        
+        Returns:
+            str: 画像を優先取得するカードHTML
+        """
+        return card_html.replace(_LAZY_LOADING_ATTR, _EAGER_LOADING_ATTR, 1)
+    
     @staticmethod
     def _get_image_html(image_url: Optional[str], title: str) -> str:
         """
-        画像URLから画像HTMLを生成（エラーハンドリング付き）
+        画像URLから画像HTMLを生成
         
         Args:
-            image_url: 画像URL（Noneの場合はデフォルト画像）
+            image_url: 画像URL（Noneの場合はプレースホルダー、Cloudinary画像はサムネイルに変換）
             title: 画像のalt属性用タイトル
         
         Returns:
             str: 画像表示用のHTML文字列
         """
-        try:
-            if image_url and image_url != "":
-                return f'<img src="{image_url}" alt="{title}">'
-            else:
-                return f'<img src="{DEFAULT_IMAGE_URL}" alt="画像なし">'
-        except Exception:
-            return f'<img src="{DEFAULT_IMAGE_URL}" alt="画像読み込みエラー">'
+        if not image_url:
+            return _PLACEHOLDER_IMAGE_HTML
+        
+        placeholder = lqip_url(image_url)
+        if placeholder is None:
+            return _IMAGE_HTML.format(src=image_url, alt=title)
+        return _LQIP_IMAGE_HTML.format(src=thumbnail_url(image_url), alt=title, placeholder=placeholder)
     
     @staticmethod
     def _get_magazine_type_class(magazine_type: str) -> str:
@@ -107,13 +180,7 @@ class BookCard:
         Returns:
             str: CSSクラス名
         """
-        type_classes = {
-            "ジャンプ": "magazine-type-jump",
-            "マガジン": "magazine-type-magazine", 
-            "サンデー": "magazine-type-sunday",
-            "その他": "magazine-type-other"
-        }
-        return type_classes.get(magazine_type, "magazine-type-other")
+        return MAGAZINE_TYPE_CLASSES.get(magazine_type, "magazine-type-other")
     
     @staticmethod
     def render_magazine_header(magazine_name: str) -> str:
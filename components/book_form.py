@@ -2,9 +2,57 @@
 BookForm Component: 漫画登録・編集フォームの共通フィールド
 """
 
+import io
 import streamlit as st
 import datetime
 from typing import Optional, Dict, Any, Tuple
+from config.constants import (
+    MAGAZINE_TYPE_ORDER,
+    OWNED_MEDIA_OPTIONS,
+    COMPLETION_STATUS_OPTIONS,
+    HAS_UNPURCHASED_OPTIONS,
+    SPECIAL_VOLUME_TYPE_OPTIONS,
+)
+from utils.session import SessionManager
+from utils.image_url import thumbnail_url
+
+# アップロード画像プレビューの最大サイズ（px。表示幅200pxの2倍）
+PREVIEW_MAX_SIZE = (400, 600)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _make_preview(file_id: str, _uploaded_file: Any) -> Optional[bytes]:
+    """
+    アップロード画像からプレビュー用の縮小画像を生成（ファイルIDごとにキャッシュ）
+    
+    元画像をそのままプレビューすると、スマホ写真など数MBの画像が
+    再実行のたびにブラウザへ送信されるため、表示サイズに縮小して送る
+    
+    Args:
+        file_id: アップロードファイルの識別子（キャッシュキー）
+        _uploaded_file: アップロードされたファイル（キャッシュキーには含めない）
+    
+    Returns:
+        Optional[bytes]: 縮小後のJPEG画像、Pillowがない場合や変換できない場合はNone
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None
+    
+    try:
+        _uploaded_file.seek(0)
+        image = ImageOps.exif_transpose(Image.open(_uploaded_file))
+        image.thumbnail(PREVIEW_MAX_SIZE)
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, format="JPEG", quality=80)
+        return buffer.getvalue()
+    except Exception as e:
+        print(f"Warning: Failed to create image preview: {str(e)}")
+        return None
+    finally:
+        # アップロード時に先頭から読み込めるよう位置を戻す
+        _uploaded_file.seek(0)
 
 
 class BookFormFields:
@@ -43,13 +91,12 @@ class BookFormFields:
             help="空欄の場合は保存時に自動生成されます"
         )
         
-        magazine_types = ["ジャンプ", "マガジン", "サンデー", "その他"]
         try:
-            magazine_type_index = magazine_types.index(default_magazine_type)
+            magazine_type_index = MAGAZINE_TYPE_ORDER.index(default_magazine_type)
         except ValueError:
             magazine_type_index = 3  # "その他"
         
-        magazine_type = st.selectbox("連載誌タイプ *", magazine_types, index=magazine_type_index)
+        magazine_type = st.selectbox("連載誌タイプ *", MAGAZINE_TYPE_ORDER, index=magazine_type_index)
         magazine_name = st.text_input(
             "連載誌名", 
             value=default_magazine_name, 
@@ -281,7 +328,7 @@ class BookFormFields:
         
         # 編集モードの場合、現在の画像を表示
         if is_edit_mode and current_image_url:
-            st.image(current_image_url, caption="現在の画像", width=200)
+            st.image(thumbnail_url(current_image_url), caption="現在の画像", width=200)
         elif is_edit_mode:
             st.info("現在、画像が登録されていません")
         
@@ -298,9 +345,11 @@ class BookFormFields:
             key=key
         )
         
-        # プレビュー表示
+        # プレビュー表示（縮小できない場合は元画像を表示）
         if uploaded_file is not None:
-            st.image(uploaded_file, caption="新しい画像プレビュー" if is_edit_mode else "アップロード予定の画像", width=200)
+            file_id = getattr(uploaded_file, "file_id", None) or f"{uploaded_file.name}:{uploaded_file.size}"
+            preview = _make_preview(file_id, uploaded_file) or uploaded_file
+            st.image(preview, caption="新しい画像プレビュー" if is_edit_mode else "アップロード予定の画像", width=200)
         
         return uploaded_file
     
@@ -394,13 +443,12 @@ class BookFormFields:
         # st.info("📔 特殊巻は作品詳細画面から個別に管理されます")
         special_volumes = ""  # 常に空文字列
         
-        media_options = ["単行本", "電子(ジャンプ+)", "電子(マガポケ)", "電子(U-NEXT)"]
         try:
-            media_index = media_options.index(default_owned_media)
+            media_index = OWNED_MEDIA_OPTIONS.index(default_owned_media)
         except ValueError:
             media_index = 0
         
-        owned_media = st.selectbox("所持媒体", media_options, index=media_index)
+        owned_media = st.selectbox("所持媒体", OWNED_MEDIA_OPTIONS, index=media_index)
         notes = st.text_area("備考", value=default_notes, placeholder="その他メモ...")
         
         return {
@@ -418,8 +466,6 @@ class BookFormFields:
         Returns:
             dict: 検索条件の辞書
         """
-        from utils.session import SessionManager
-        
         # セッションから保存された検索条件を取得
         saved_filters = SessionManager.get_search_filters()
         
@@ -435,7 +481,6 @@ class BookFormFields:
             )
             
             # 雑誌タイプ検索（マルチセレクト）
-            magazine_types = ["ジャンプ", "マガジン", "サンデー", "その他"]
             saved_magazine_types = saved_filters.get("magazine_types", [])
             # 旧形式の互換性を維持
             if isinstance(saved_magazine_types, str) and saved_magazine_types != "すべて":
@@ -445,7 +490,7 @@ class BookFormFields:
             
             magazine_type_filter = st.multiselect(
                 "📰 連載誌タイプ",
-                magazine_types,
+                MAGAZINE_TYPE_ORDER,
                 default=saved_magazine_types,
                 help="複数選択可能。未選択の場合は全て表示"
             )
@@ -460,28 +505,25 @@ class BookFormFields:
         
         with col2:
             # 連載状況フィルター
-            completion_status_options = ["すべて", "連載中", "完結"]
             saved_completion_status = saved_filters.get("completion_status", "すべて")
-            completion_status_index = completion_status_options.index(saved_completion_status) if saved_completion_status in completion_status_options else 0
+            completion_status_index = COMPLETION_STATUS_OPTIONS.index(saved_completion_status) if saved_completion_status in COMPLETION_STATUS_OPTIONS else 0
             completion_status_filter = st.selectbox(
                 "📚 連載状況",
-                completion_status_options,
+                COMPLETION_STATUS_OPTIONS,
                 index=completion_status_index
             )
             
             # 未所持巻フィルター
-            has_unpurchased_options = ["すべて", "あり", "なし"]
             saved_has_unpurchased = saved_filters.get("has_unpurchased", "すべて")
-            has_unpurchased_index = has_unpurchased_options.index(saved_has_unpurchased) if saved_has_unpurchased in has_unpurchased_options else 0
+            has_unpurchased_index = HAS_UNPURCHASED_OPTIONS.index(saved_has_unpurchased) if saved_has_unpurchased in HAS_UNPURCHASED_OPTIONS else 0
             has_unpurchased_filter = st.selectbox(
                 "📋 未所持巻",
-                has_unpurchased_options,
+                HAS_UNPURCHASED_OPTIONS,
                 index=has_unpurchased_index,
                 help="未購入の巻があるかどうかで絞り込み"
             )
             
             # 所持媒体フィルター（マルチセレクト）
-            owned_media_options = ["単行本", "電子(ジャンプ+)", "電子(マガポケ)", "電子(U-NEXT)"]
             saved_owned_medias = saved_filters.get("owned_medias", [])
             # 旧形式の互換性を維持
             if isinstance(saved_owned_medias, str) and saved_owned_medias != "すべて":
@@ -491,7 +533,7 @@ class BookFormFields:
                 
             owned_media_filter = st.multiselect(
                 "💻 所持媒体",
-                owned_media_options,
+                OWNED_MEDIA_OPTIONS,
                 default=saved_owned_medias,
                 help="複数選択可能。未選択の場合は全て表示"
             )
@@ -557,10 +599,9 @@ class BookFormFields:
             )
             
             # 作品タイプ
-            type_options = ["特殊巻", "外伝", "ガイドブック", "映画", "小説"]
             volume_type = st.selectbox(
                 "📋 作品タイプ *",
-                type_options,
+                SPECIAL_VOLUME_TYPE_OPTIONS,
                 help="特殊巻の種類を選択してください"
             )
             
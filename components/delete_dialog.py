@@ -3,10 +3,16 @@ DeleteDialog Component: 削除確認ダイアログ
 """
 
 import streamlit as st
-import time
-from typing import Dict, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from models.manga import Manga
 from services.manga_service import MangaService
 from services.image_service import ImageService
+from services.special_volume_service import SpecialVolumeService
+from utils.session import SessionManager
+
+# Notionページ削除の同時実行数
+DELETE_MAX_WORKERS = 10
 
 
 class DeleteDialog:
@@ -14,28 +20,32 @@ class DeleteDialog:
     
     @staticmethod
     def show(
-        book: Dict[str, Any],
+        book: Manga,
         manga_service: MangaService,
         image_service: ImageService,
-        on_success_callback: Callable[[], None]
+        on_success_callback: Callable[[], None],
+        special_volume_service: Optional[SpecialVolumeService] = None
     ) -> None:
         """
         削除確認ダイアログを表示
         
         Args:
-            book: 削除対象の漫画データ（dict形式）
+            book: 削除対象の漫画オブジェクト
             manga_service: MangaServiceインスタンス
             image_service: ImageServiceインスタンス
             on_success_callback: 削除成功時のコールバック関数
+            special_volume_service: SpecialVolumeServiceインスタンス（指定時は関連特殊巻も削除）
         """
-        st.warning(f"**{book['title']}** を削除しますか？")
+        st.warning(f"**{book.title}** を削除しますか？")
         st.error("⚠️ この操作は取り消せません。")
         
         col1, col2 = st.columns(2)
         
         with col1:
             if st.button("🗑️ 削除する", type="primary", use_container_width=True):
-                DeleteDialog._handle_delete(book, manga_service, image_service, on_success_callback)
+                DeleteDialog._handle_delete(
+                    book, manga_service, image_service, on_success_callback, special_volume_service
+                )
         
         with col2:
             if st.button("❌ キャンセル", use_container_width=True):
@@ -43,40 +53,69 @@ class DeleteDialog:
     
     @staticmethod
     def _handle_delete(
-        book: Dict[str, Any],
+        book: Manga,
         manga_service: MangaService,
         image_service: ImageService,
-        on_success_callback: Callable[[], None]
+        on_success_callback: Callable[[], None],
+        special_volume_service: Optional[SpecialVolumeService] = None
     ) -> None:
         """
         削除処理を実行
         
+        削除対象のページIDと画像URLを先にまとめて収集し、漫画の削除に成功した後で
+        特殊巻のNotionページは並行してアーカイブ、画像は一括削除する
+        （漫画の削除に失敗した場合は特殊巻・画像を残す）
+        
         Args:
-            book: 削除対象の漫画データ
+            book: 削除対象の漫画オブジェクト
             manga_service: MangaServiceインスタンス
             image_service: ImageServiceインスタンス
             on_success_callback: 削除成功時のコールバック関数
+            special_volume_service: SpecialVolumeServiceインスタンス
         """
         try:
-            # ImageServiceを使用して画像削除
-            image_url = book.get("image_url")
-            if image_url:
-                with st.spinner("画像を削除中..."):
-                    if image_service.delete_image(image_url):
-                        st.success("✅ 画像を削除しました")
+            # 関連する特殊巻を収集
+            special_volumes = []
+            if special_volume_service:
+                special_volumes = special_volume_service.get_special_volumes_by_book_id(book.id)
+            
+            image_urls = [book.image_url] + [volume.image_url for volume in special_volumes]
+            image_urls = [url for url in image_urls if url]
             
-            # MangaServiceを使用してNotionレコード削除
             with st.spinner("データを削除中..."):
-                if manga_service.delete_manga(book["id"]):
-                    st.success("✅ 漫画を削除しました")
-                else:
+                # 漫画のNotionレコードを先に削除（失敗時は関連データに手を付けない）
+                if not manga_service.delete_manga(book.id):
                     raise Exception("削除に失敗しました")
+                # 結果はトーストで通知（再実行後も表示が残る）
+                st.toast("漫画を削除しました", icon="✅")
+                
+                with ThreadPoolExecutor(max_workers=DELETE_MAX_WORKERS) as executor:
+                    # ImageServiceを使用して画像を一括削除
+                    image_future = None
+                    if image_urls and image_service.is_available():
+                        image_future = executor.submit(image_service.delete_images, image_urls)
+                    
+                    # 特殊巻のNotionレコードを並行して削除
+                    volume_futures = [
+                        executor.submit(special_volume_service.delete_special_volume, volume.id)
+                        for volume in special_volumes
+                    ]
+                    
+                    failed_volumes = sum(1 for future in volume_futures if not future.result())
+                    if special_volumes:
+                        SessionManager.clear_special_volumes_cache()
+                        if failed_volumes:
+                            st.toast(f"特殊巻 {failed_volumes} 件の削除に失敗しました", icon="⚠️")
+                        else:
+                            st.toast(f"特殊巻 {len(special_volumes)} 件を削除しました", icon="✅")
+                    
+                    if image_future is not None and image_future.result():
+                        st.toast("画像を削除しました", icon="✅")
             
             # セッション状態をクリア
             st.session_state.selected_book = None
             
-            # 削除成功後、少し待ってからコールバック実行
-            time.sleep(1)
+            # 削除成功後、待たずにコールバック実行
             on_success_callback()
             st.rerun()
             
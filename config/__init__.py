@@ -4,20 +4,34 @@ Config package: Application constants and configuration
 
 from .constants import (
     DEFAULT_IMAGE_URL,
+    PLACEHOLDER_IMAGE_SVG,
     PAGE_HOME,
     PAGE_DETAIL,
     PAGE_ADD,
     PAGE_EDIT,
     MAGAZINE_TYPE_ORDER,
     MAGAZINE_LOGOS,
+    MAGAZINE_NAME_ORDER,
+    MAGAZINE_TYPE_CLASSES,
+    OWNED_MEDIA_OPTIONS,
+    COMPLETION_STATUS_OPTIONS,
+    HAS_UNPURCHASED_OPTIONS,
+    SPECIAL_VOLUME_TYPE_OPTIONS,
 )
 
 __all__ = [
     'DEFAULT_IMAGE_URL',
+    'PLACEHOLDER_IMAGE_SVG',
     'PAGE_HOME',
     'PAGE_DETAIL',
     'PAGE_ADD',
     'PAGE_EDIT',
     'MAGAZINE_TYPE_ORDER',
     'MAGAZINE_LOGOS',
+    'MAGAZINE_NAME_ORDER',
+    'MAGAZINE_TYPE_CLASSES',
+    'OWNED_MEDIA_OPTIONS',
+    'COMPLETION_STATUS_OPTIONS',
+    'HAS_UNPURCHASED_OPTIONS',
+    'SPECIAL_VOLUME_TYPE_OPTIONS',
 ]
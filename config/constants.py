@@ -7,6 +7,15 @@ Application Constants
 # =========================
 DEFAULT_IMAGE_URL = "https://res.cloudinary.com/do6trtdrp/image/upload/v1762307174/noimage_czluse.jpg"
 
+# 画像なし時のプレースホルダー（インラインSVGのため画像の取得通信が発生しない）
+PLACEHOLDER_IMAGE_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="400" height="600" viewBox="0 0 400 600">'
+    '<rect width="400" height="600" fill="#e9ecef"/>'
+    '<text x="200" y="290" font-size="96" text-anchor="middle">📚</text>'
+    '<text x="200" y="370" font-size="32" fill="#6c757d" text-anchor="middle">No Image</text>'
+    '</svg>'
+)
+
 # =========================
 # ページ名定数
 # =========================
@@ -20,6 +29,30 @@ PAGE_EDIT = "edit_book"
 # =========================
 MAGAZINE_TYPE_ORDER = ["ジャンプ", "マガジン", "サンデー", "その他"]
 
+# 雑誌タイプごとの雑誌名表示順序
+MAGAZINE_NAME_ORDER = {
+    "ジャンプ": ("週刊少年ジャンプ", "週刊ヤングジャンプ", "ジャンプ+", "ジャンプSQ", "ジャンプGIGA"),
+    "マガジン": ("週刊少年マガジン", "週刊ヤングマガジン", "月刊少年マガジン", "別冊少年マガジン"),
+    "サンデー": ("週刊少年サンデー", "少年サンデーＳ（スーパー）", "裏サンデー"),
+    "その他": ("週刊ビッグコミックスピリッツ", "月刊コミックゼノン", "月刊アフタヌーン"),
+}
+
+# 雑誌タイプごとのCSSクラス
+MAGAZINE_TYPE_CLASSES = {
+    "ジャンプ": "magazine-type-jump",
+    "マガジン": "magazine-type-magazine",
+    "サンデー": "magazine-type-sunday",
+    "その他": "magazine-type-other",
+}
+
+# =========================
+# フォーム選択肢
+# =========================
+OWNED_MEDIA_OPTIONS = ("単行本", "電子(ジャンプ+)", "電子(マガポケ)", "電子(U-NEXT)")
+COMPLETION_STATUS_OPTIONS = ("すべて", "連載中", "完結")
+HAS_UNPURCHASED_OPTIONS = ("すべて", "あり", "なし")
+SPECIAL_VOLUME_TYPE_OPTIONS = ("特殊巻", "外伝", "ガイドブック", "映画", "小説")
+
 # =========================
 # 雑誌ロゴパス
 # =========================
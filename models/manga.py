@@ -1,7 +1,63 @@
 """漫画データモデル"""
+import re
 from dataclasses import dataclass
-from typing import Optional
-from datetime import date, datetime
+from typing import List, Optional
+from datetime import date
+from models.notion_props import pick
+
+# Notionへ送信するプロパティの種類ごとのフィールド一覧
+# リッチテキスト（空の場合は値をクリアする）
+_CLEARABLE_RICH_TEXT_FIELDS = ("magazine_name", "missing_volumes", "notes")
+# セレクト（空の場合は送信しない）
+_SELECT_FIELDS = ("magazine_type", "owned_media")
+# 日付（未設定の場合は送信しない）
+_DATE_FIELDS = ("latest_release_date", "next_release_date")
+# リレーション（属性名, プロパティ名。有効なIDがない場合は送信しない）
+_RELATION_FIELDS = (
+    ("related_books_to", "relation_books_to"),
+    ("related_books_from", "relation_books_from"),
+)
+
+# 画像URLとして受け付けるスキーム（http/https、大文字小文字は区別しない）の判定
+_match_http_url = re.compile(r"^https?://", re.IGNORECASE).match
+
+
+def _relation_ids(props: dict, name: str) -> Optional[List[str]]:
+    """リレーションプロパティのページID一覧を取得（空の場合はNone）"""
+    return [rel["id"] for rel in pick(props, (name, "relation"), ())] or None
+
+
+def _valid_relation_ids(book_ids) -> List[str]:
+    """送信可能なリレーションのページID一覧を取得（リスト以外や空のIDは除外）"""
+    if not isinstance(book_ids, list):
+        return []
+    return [book_id for book_id in book_ids if book_id and isinstance(book_id, str)]
+
+
+def _missing_volume_count(missing_volumes: str) -> int:
+    """カンマ区切りの抜け巻文字列から抜け巻の数を取得（空の要素は数えない）"""
+    return sum(1 for volume in missing_volumes.split(",") if volume.strip())
+
+
+def _parse_date(date_str: Optional[str]) -> Optional[date]:
+    """Notionの日付文字列をdateに変換（時刻付きの場合も日付部分のみを使用）"""
+    if not date_str:
+        return None
+    try:
+        return date.fromisoformat(date_str[:10])
+    except ValueError:
+        return None
+
+
+def _text_value(value) -> str:
+    """空白のみの値を空文字として扱い、文字列に変換"""
+    return str(value) if value and str(value).strip() else ""
+
+
+def _rich_text(value: str) -> dict:
+    """リッチテキストプロパティを生成（空文字の場合は空のリッチテキスト）"""
+    return {"rich_text": [{"text": {"content": value}}] if value else []}
+
 
 @dataclass
 class Manga:
@@ -27,9 +83,6 @@ class Manga:
     owned_media: str = "単行本"
     notes: str = ""
     
-    # Notion APIの生データも保持（互換性のため）
-    _page_data: Optional[dict] = None
-    
     @property
     def actual_owned_volume(self) -> int:
         """実際の所持巻数（抜け巻を除く）
@@ -39,12 +92,7 @@ class Manga:
         """
         if not self.missing_volumes:
             return self.latest_owned_volume
-        
-        try:
-            missing_list = [v.strip() for v in self.missing_volumes.split(",") if v.strip()]
-            return self.latest_owned_volume - len(missing_list)
-        except:
-            return self.latest_owned_volume
+        return self.latest_owned_volume - _missing_volume_count(self.missing_volumes)
     
     @property
     def has_unpurchased(self) -> bool:
@@ -78,8 +126,7 @@ class Manga:
             "latest_released_volume": self.latest_released_volume,
             "is_completed": self.is_completed,
             "magazine_type": self.magazine_type,
-            "magazine_name": self.magazine_name,
-            "page_data": self._page_data
+            "magazine_name": self.magazine_name
         }
     
     @classmethod
@@ -94,93 +141,30 @@ class Manga:
         """
         props = page["properties"]
         
-        # タイトル取得
-        title = "タイトル不明"
-        if props.get("title", {}).get("title"):
-            title = props["title"]["title"][0]["text"]["content"]
-        
-        # タイトルかな
-        title_kana = ""
-        if props.get("title_kana", {}).get("rich_text") and props["title_kana"]["rich_text"]:
-            title_kana = props["title_kana"]["rich_text"][0]["text"]["content"]
-        
-        # リレーション情報の取得（新しいプロパティ名を使用）
-        related_books_to = None
-        if props.get("relation_books_to", {}).get("relation"):
-            related_books_to = [rel["id"] for rel in props["relation_books_to"]["relation"]]
-        
-        related_books_from = None
-        if props.get("relation_books_from", {}).get("relation"):
-            related_books_from = [rel["id"] for rel in props["relation_books_from"]["relation"]]
-        
         # 画像URL
-        image_url = props.get("image_url", {}).get("url")
-        if not image_url or not image_url.startswith(('http://', 'https://')):
+        image_url = pick(props, ("image_url", "url"))
+        if image_url and not _match_http_url(image_url):
             image_url = None
         
-        # 雑誌タイプ
-        magazine_type = "その他"
-        if props.get("magazine_type", {}).get("select"):
-            magazine_type = props["magazine_type"]["select"]["name"]
-        
-        # 雑誌名
-        magazine_name = "不明"
-        if props.get("magazine_name", {}).get("rich_text") and props["magazine_name"]["rich_text"]:
-            magazine_name = props["magazine_name"]["rich_text"][0]["text"]["content"]
-        
-        # 日付情報
-        latest_release_date = None
-        if props.get("latest_release_date", {}).get("date"):
-            try:
-                date_str = props["latest_release_date"]["date"]["start"]
-                latest_release_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except:
-                pass
-        
-        next_release_date = None
-        if props.get("next_release_date", {}).get("date"):
-            try:
-                date_str = props["next_release_date"]["date"]["start"]
-                next_release_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            except:
-                pass
-        
-        # その他のテキストフィールド
-        missing_volumes = ""
-        if props.get("missing_volumes", {}).get("rich_text") and props["missing_volumes"]["rich_text"]:
-            missing_volumes = props["missing_volumes"]["rich_text"][0]["text"]["content"]
-        
-        special_volumes = ""
-        if props.get("special_volumes", {}).get("rich_text") and props["special_volumes"]["rich_text"]:
-            special_volumes = props["special_volumes"]["rich_text"][0]["text"]["content"]
-        
-        owned_media = "単行本"
-        if props.get("owned_media", {}).get("select"):
-            owned_media = props["owned_media"]["select"]["name"]
-        
-        notes = ""
-        if props.get("notes", {}).get("rich_text") and props["notes"]["rich_text"]:
-            notes = props["notes"]["rich_text"][0]["text"]["content"]
-        
         return cls(
             id=page["id"],
-            title=title,
-            title_kana=title_kana,
-            magazine_type=magazine_type,
-            magazine_name=magazine_name,
-            latest_owned_volume=props.get("latest_owned_volume", {}).get("number", 0),
-            latest_released_volume=props.get("latest_released_volume", {}).get("number", 0),
-            is_completed=props.get("is_completed", {}).get("checkbox", False),
+            title=pick(props, ("title", "title", 0, "text", "content"), "タイトル不明"),
+            title_kana=pick(props, ("title_kana", "rich_text", 0, "text", "content"), ""),
+            magazine_type=pick(props, ("magazine_type", "select", "name"), "その他"),
+            magazine_name=pick(props, ("magazine_name", "rich_text", 0, "text", "content"), "不明"),
+            latest_owned_volume=pick(props, ("latest_owned_volume", "number"), 0),
+            latest_released_volume=pick(props, ("latest_released_volume", "number"), 0),
+            is_completed=pick(props, ("is_completed", "checkbox"), False),
             image_url=image_url,
-            related_books_to=related_books_to,
-            related_books_from=related_books_from,
-            latest_release_date=latest_release_date,
-            next_release_date=next_release_date,
-            missing_volumes=missing_volumes,
-            special_volumes=special_volumes,
-            owned_media=owned_media,
-            notes=notes,
-            _page_data=page  # 元データを保持
+            # リレーション情報の取得（新しいプロパティ名を使用）
+            related_books_to=_relation_ids(props, "relation_books_to"),
+            related_books_from=_relation_ids(props, "relation_books_from"),
+            latest_release_date=_parse_date(pick(props, ("latest_release_date", "date", "start"))),
+            next_release_date=_parse_date(pick(props, ("next_release_date", "date", "start"))),
+            missing_volumes=pick(props, ("missing_volumes", "rich_text", 0, "text", "content"), ""),
+            special_volumes=pick(props, ("special_volumes", "rich_text", 0, "text", "content"), ""),
+            owned_media=pick(props, ("owned_media", "select", "name"), "単行本"),
+            notes=pick(props, ("notes", "rich_text", 0, "text", "content"), "")
         )
     
     def to_notion_properties(self) -> dict:
@@ -199,62 +183,42 @@ class Manga:
             }
             
             # オプショナルプロパティ
-            if self.title_kana and str(self.title_kana).strip():
-                properties["title_kana"] = {"rich_text": [{"text": {"content": str(self.title_kana)}}]}
+            title_kana = _text_value(self.title_kana)
+            if title_kana:
+                properties["title_kana"] = _rich_text(title_kana)
             
             # リレーション情報を設定（新しいプロパティ名を使用）
-            if self.related_books_to and isinstance(self.related_books_to, list):
-                valid_ids = [book_id for book_id in self.related_books_to if book_id and isinstance(book_id, str)]
-                if valid_ids:
-                    properties["relation_books_to"] = {"relation": [{"id": book_id} for book_id in valid_ids]}
+            properties.update({
+                name: {"relation": [{"id": book_id} for book_id in valid_ids]}
+                for attr, name in _RELATION_FIELDS
+                if (valid_ids := _valid_relation_ids(getattr(self, attr)))
+            })
             
-            if self.related_books_from and isinstance(self.related_books_from, list):
-                valid_ids = [book_id for book_id in self.related_books_from if book_id and isinstance(book_id, str)]
-                if valid_ids:
-                    properties["relation_books_from"] = {"relation": [{"id": book_id} for book_id in valid_ids]}
-        
             # 日付フィールド
-            if self.latest_release_date:
-                try:
-                    properties["latest_release_date"] = {"date": {"start": self.latest_release_date.isoformat()}}
-                except:
-                    pass  # 日付変換に失敗した場合は無視
-            
-            if self.next_release_date:
-                try:
-                    properties["next_release_date"] = {"date": {"start": self.next_release_date.isoformat()}}
-                except:
-                    pass  # 日付変換に失敗した場合は無視
+            properties.update({
+                name: {"date": {"start": value.isoformat()}}
+                for name in _DATE_FIELDS
+                if (value := getattr(self, name))
+            })
             
             # セレクトフィールド
-            if self.magazine_type and str(self.magazine_type).strip():
-                properties["magazine_type"] = {"select": {"name": str(self.magazine_type)}}
+            properties.update({
+                name: {"select": {"name": value}}
+                for name in _SELECT_FIELDS
+                if (value := _text_value(getattr(self, name)))
+            })
             
             # リッチテキストフィールド
-            if self.magazine_name and str(self.magazine_name).strip():
-                properties["magazine_name"] = {"rich_text": [{"text": {"content": str(self.magazine_name)}}]}
-            else:
-                properties["magazine_name"] = {"rich_text": []}
-            
-            if self.missing_volumes and str(self.missing_volumes).strip():
-                properties["missing_volumes"] = {"rich_text": [{"text": {"content": str(self.missing_volumes)}}]}
-            else:
-                properties["missing_volumes"] = {"rich_text": []}
-            
-            # special_volumesフィールドは削除（現在はspecial_volumesテーブルとの双方向リレーションで管理）
-            # 下位互換性のため、フィールド自体は保持するが、Notion更新時は送信しない
-            
-            if self.owned_media and str(self.owned_media).strip():
-                properties["owned_media"] = {"select": {"name": str(self.owned_media)}}
-            
-            if self.notes and str(self.notes).strip():
-                properties["notes"] = {"rich_text": [{"text": {"content": str(self.notes)}}]}
-            else:
-                properties["notes"] = {"rich_text": []}
+            # special_volumesフィールドは送信しない（現在はspecial_volumesテーブルとの双方向リレーションで管理）
+            properties.update({
+                name: _rich_text(_text_value(getattr(self, name)))
+                for name in _CLEARABLE_RICH_TEXT_FIELDS
+            })
             
             # URLフィールド
-            if self.image_url and str(self.image_url).strip() and str(self.image_url).startswith(('http://', 'https://')):
-                properties["image_url"] = {"url": str(self.image_url)}
+            image_url = _text_value(self.image_url)
+            if image_url and _match_http_url(image_url):
+                properties["image_url"] = {"url": image_url}
             
             return properties
         
@@ -273,12 +237,7 @@ class Manga:
         
         # 抜け巻がある場合の計算
         if self.missing_volumes:
-            try:
-                missing_list = [vol.strip() for vol in self.missing_volumes.split(",") if vol.strip()]
-                missing_count = len(missing_list)
-                return max(0, owned_count - missing_count)
-            except:
-                return owned_count
+            return max(0, owned_count - _missing_volume_count(self.missing_volumes))
         
         return owned_count
     
@@ -0,0 +1,24 @@
+"""Notionプロパティの値を取り出すヘルパー"""
+from typing import Any, Sequence
+
+
+def pick(props: dict, path: Sequence, default: Any = None) -> Any:
+    """Notionプロパティから階層をたどって値を取得
+    
+    途中のキーが存在しない・リストが空・値がNoneの場合はdefaultを返す
+    
+    Args:
+        props: Notionページのプロパティ辞書
+        path: たどるキー・インデックスの並び（例: ("title", "title", 0, "text", "content")）
+        default: 値が取得できない場合の既定値
+    
+    Returns:
+        取得した値、またはdefault
+    """
+    value = props
+    try:
+        for key in path:
+            value = value[key]
+    except (KeyError, IndexError, TypeError):
+        return default
+    return default if value is None else value
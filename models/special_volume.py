@@ -4,7 +4,7 @@ Special Volume Model: データクラス定義
 
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
-from datetime import datetime
+from models.notion_props import pick
 
 
 @dataclass
@@ -31,36 +31,15 @@ class SpecialVolume:
         """
         props = page.get("properties", {})
         
-        # タイトル
-        title = ""
-        if props.get("title", {}).get("title"):
-            title = props["title"]["title"][0]["text"]["content"]
-        
-        # リレーション（book）
-        book_id = ""
-        if props.get("book", {}).get("relation") and props["book"]["relation"]:
-            book_id = props["book"]["relation"][0]["id"]
-        
-        # 並び順
-        sort_order = props.get("sort_order", {}).get("number", 0)
-        
-        # タイプ
-        type_name = ""
-        if props.get("type", {}).get("select"):
-            type_name = props["type"]["select"]["name"]
-        
-        # 画像URL
-        image_url = None
-        if props.get("image_url", {}).get("url"):
-            image_url = props["image_url"]["url"]
-        
         return cls(
             id=page["id"],
-            title=title,
-            book_id=book_id,
-            sort_order=sort_order,
-            type=type_name,
-            image_url=image_url
+            title=pick(props, ("title", "title", 0, "text", "content"), ""),
+            # リレーション（book）
+            book_id=pick(props, ("book", "relation", 0, "id"), ""),
+            # 並び順
+            sort_order=pick(props, ("sort_order", "number"), 0),
+            type=pick(props, ("type", "select", "name"), ""),
+            image_url=pick(props, ("image_url", "url")) or None
         )
     
     def to_notion_properties(self) -> Dict[str, Any]:
@@ -2,34 +2,111 @@
 Image Service: Cloudinary image upload and deletion operations
 """
 
+import hashlib
+import importlib.util
+import io
 import re
-from typing import Optional, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Any, Iterable, Mapping
+
+# チャンクアップロード時の1チャンクあたりのサイズ（バイト）
+UPLOAD_CHUNK_SIZE = 6 * 1024 * 1024
+
+# アップロード前に縮小する最大サイズ（px）とJPEG画質
+UPLOAD_MAX_SIZE = (1200, 1800)
+UPLOAD_JPEG_QUALITY = 85
+
+# 一括削除APIで1回に指定できるpublic_idの上限
+BULK_DELETE_LIMIT = 100
+
+
+@lru_cache(maxsize=1)
+def cloudinary_installed() -> bool:
+    """
+    Cloudinaryライブラリがインストールされているか（存在確認のみ、結果はプロセス内でキャッシュ）
+    
+    実際のインポートは初回アップロード時まで遅延する
+    
+    Returns:
+        bool: インポート可能ならTrue
+    """
+    return importlib.util.find_spec("cloudinary") is not None
+
+
+@lru_cache(maxsize=4)
+def _configured_uploader(cloud_name: Optional[str], api_key: Optional[str], api_secret: Optional[str]) -> Any:
+    """
+    Cloudinary SDKをインポート・設定してuploaderを返す（設定値ごとにプロセス内で一度だけ実行）
+    
+    Args:
+        cloud_name: Cloudinaryのクラウド名（Noneの場合は設定しない）
+        api_key: Cloudinary API Key
+        api_secret: Cloudinary API Secret
+    
+    Returns:
+        Any: cloudinary.uploaderモジュール
+    """
+    import cloudinary
+    import cloudinary.uploader
+    if cloud_name is not None:
+        cloudinary.config(cloud_name=cloud_name, api_key=api_key, api_secret=api_secret)
+    return cloudinary.uploader
 
 
 class ImageService:
-    """Cloudinary画像のアップロード・削除を行うサービスクラス"""
+    """
+    Cloudinary画像のアップロード・削除を行うサービスクラス
     
-    def __init__(self, cloudinary_available: bool = False, cloudinary_enabled: bool = False):
+    インスタンスはst.cache_resourceでプロセス内に一つだけ生成され、全セッションで共有される。
+    そのため利用可否のフラグは生成後に変更せず、セッション固有の状態も持たない。
+    """
+    
+    # バックグラウンドアップロード用のワーカー（プロセス全体で共有）
+    _upload_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cloudinary-upload")
+    
+    def __init__(
+        self,
+        cloudinary_available: bool = False,
+        cloudinary_enabled: bool = False,
+        cloudinary_config: Optional[Mapping[str, str]] = None
+    ):
         """
         ImageServiceの初期化
         
+        Cloudinary SDKのインポートと設定は初回利用時まで遅延する
+        
         Args:
             cloudinary_available: Cloudinaryライブラリがインポート可能か
             cloudinary_enabled: Cloudinary設定が有効か
+            cloudinary_config: cloud_name / api_key / api_secret を含む設定
         """
         self.cloudinary_available = cloudinary_available
         self.cloudinary_enabled = cloudinary_enabled
+        self.cloudinary_config = cloudinary_config
+        self._uploader = None
+    
+    @property
+    def uploader(self) -> Any:
+        """
+        cloudinary.uploaderを取得（初回アクセス時にインポートと設定を行う）
         
-        if self.cloudinary_available and self.cloudinary_enabled:
+        Returns:
+            Any: cloudinary.uploaderモジュール、利用できない場合はNone
+        """
+        if self._uploader is None and self.cloudinary_available and self.cloudinary_enabled:
             try:
-                import cloudinary.uploader
-                self.uploader = cloudinary.uploader
-            except ImportError:
-                self.cloudinary_available = False
-                self.cloudinary_enabled = False
-                self.uploader = None
-        else:
-            self.uploader = None
+                # SDKのインポートと設定は設定値ごとにプロセス内で一度だけ行う
+                config = self.cloudinary_config
+                if config:
+                    credentials = (config["cloud_name"], config["api_key"], config["api_secret"])
+                else:
+                    credentials = (None, None, None)
+                self._uploader = _configured_uploader(*credentials)
+            except Exception as e:
+                # 共有インスタンスのフラグは書き換えず、利用不可（None）として扱う
+                print(f"Error initializing Cloudinary: {str(e)}")
+        return self._uploader
     
     def is_available(self) -> bool:
         """
@@ -40,12 +117,15 @@ class ImageService:
         """
         return self.cloudinary_available and self.cloudinary_enabled and self.uploader is not None
     
-    def upload_image(self, file: Any) -> Optional[str]:
+    def upload_image(self, file: Any, upload_token: str) -> Optional[str]:
         """
         画像をCloudinaryにアップロード
         
+        表示サイズに合わせて縮小した上で、チャンク単位で送信する
+        
         Args:
             file: アップロードするファイルオブジェクト（Streamlit UploadedFile等）
+            upload_token: 送信ごとのトークン（SessionManager.get_upload_token で取得）
         
         Returns:
             Optional[str]: アップロード成功時はsecure_url、失敗時はNone
@@ -57,12 +137,127 @@ class ImageService:
             raise Exception("Cloudinary is not available or not properly configured")
         
         try:
-            result = self.uploader.upload(file)
+            # 同じ送信の再実行・リトライで重複アセットを作らないよう、内容のハッシュと
+            # 送信トークンからpublic_idを決め、既存アセットは上書きしない
+            # （トークンは保存成功ごとに変わるため、別の作品が同じ画像を使っても
+            # アセットは共有されず、片方の削除でもう片方の画像が消えることはない）
+            public_id = f"{self._content_hash(file)}_{upload_token}"
+            
+            # 表示サイズを大きく超える画像は縮小・再エンコードしてから送信
+            upload_file = self._downscale_image(file)
+            result = self.uploader.upload_large(
+                upload_file,
+                chunk_size=UPLOAD_CHUNK_SIZE,
+                resource_type="image",
+                public_id=public_id,
+                overwrite=False,
+                unique_filename=False
+            )
             return result.get("secure_url")
         except Exception as e:
             print(f"Error uploading image: {str(e)}")
             raise
     
+    @staticmethod
+    def _content_hash(file: Any) -> str:
+        """
+        ファイル内容のSHA-1ハッシュを計算（アップロード時のpublic_idに使用）
+        
+        Args:
+            file: ファイルオブジェクト（Streamlit UploadedFile等）
+        
+        Returns:
+            str: 16進数のハッシュ文字列
+        """
+        digest = hashlib.sha1()
+        if hasattr(file, "seek"):
+            file.seek(0)
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+        if hasattr(file, "seek"):
+            file.seek(0)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _downscale_image(file: Any) -> Any:
+        """
+        アップロード前に画像を縮小・再エンコード
+        
+        UPLOAD_MAX_SIZE に収まるよう縦横比を保って縮小し、
+        透過なしの画像はJPEG、透過ありの画像はPNGで保存し直す。
+        Pillowがない場合や読み込めない画像は元のファイルをそのまま返す。
+        
+        Args:
+            file: アップロードするファイルオブジェクト（Streamlit UploadedFile等）
+        
+        Returns:
+            Any: 縮小後の画像（BytesIO）または元のファイルオブジェクト
+        """
+        # 読み取り済みの可能性があるため先頭に戻す
+        if hasattr(file, "seek"):
+            file.seek(0)
+        
+        try:
+            from PIL import Image, ImageOps
+        except ImportError:
+            return file
+        
+        try:
+            image = Image.open(file)
+            # スマホ写真のEXIF回転情報を画素に反映
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail(UPLOAD_MAX_SIZE, Image.LANCZOS)
+            
+            buffer = io.BytesIO()
+            if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+                image.save(buffer, format="PNG", optimize=True)
+            else:
+                image.convert("RGB").save(
+                    buffer,
+                    format="JPEG",
+                    quality=UPLOAD_JPEG_QUALITY,
+                    optimize=True,
+                    progressive=True
+                )
+            buffer.seek(0)
+            return buffer
+            
+        except Exception as e:
+            print(f"Warning: Failed to downscale image, uploading original: {str(e)}")
+            if hasattr(file, "seek"):
+                file.seek(0)
+            return file
+    
+    def start_upload(self, file: Any, upload_token: str) -> Future:
+        """
+        画像アップロードをバックグラウンドで開始
+        
+        アップロード中に呼び出し元で別の処理（タイトルかな生成など）を進め、
+        必要になった時点で result() で結果を受け取る
+        
+        Args:
+            file: アップロードするファイルオブジェクト（Streamlit UploadedFile等）
+            upload_token: 送信ごとのトークン
+        
+        Returns:
+            Future: result() でsecure_urlを返すFuture（失敗時は例外を送出）
+        """
+        return self._upload_executor.submit(self.upload_image, file, upload_token)
+    
+    def start_replace(self, old_url: Optional[str], new_file: Any, upload_token: str) -> Future:
+        """
+        画像の置き換えをバックグラウンドで開始
+        
+        Args:
+            old_url: 削除する古い画像のURL（Noneの場合は削除スキップ）
+            new_file: アップロードする新しいファイル
+            upload_token: 送信ごとのトークン
+        
+        Returns:
+            Future: result() で新しい画像のURLを返すFuture（失敗時は例外を送出）
+        """
+        return self._upload_executor.submit(self.replace_image, old_url, new_file, upload_token)
+    
     def delete_image(self, image_url: str) -> bool:
         """
         CloudinaryのURLから画像を削除
@@ -96,6 +291,48 @@ class ImageService:
             print(f"Error deleting image: {str(e)}")
             return False
     
+    def delete_images(self, image_urls: Iterable[str]) -> int:
+        """
+        複数のCloudinary画像をまとめて削除
+        
+        1枚ずつdestroyを呼ばず、一括削除API（delete_resources）で
+        最大100件ずつ削除する
+        
+        Args:
+            image_urls: Cloudinary画像のURL一覧（Cloudinary以外のURLは無視）
+        
+        Returns:
+            int: 削除できた画像の数
+        """
+        if not self.is_available():
+            print("Cloudinary is not available")
+            return 0
+        
+        public_ids = []
+        for image_url in image_urls:
+            if not image_url or "cloudinary.com" not in image_url:
+                continue
+            public_id = self._extract_public_id(image_url)
+            if public_id and public_id not in public_ids:
+                public_ids.append(public_id)
+        
+        if not public_ids:
+            return 0
+        
+        try:
+            import cloudinary.api
+            
+            deleted_count = 0
+            for i in range(0, len(public_ids), BULK_DELETE_LIMIT):
+                result = cloudinary.api.delete_resources(public_ids[i:i + BULK_DELETE_LIMIT])
+                deleted = result.get("deleted", {})
+                deleted_count += sum(1 for status in deleted.values() if status == "deleted")
+            return deleted_count
+        
+        except Exception as e:
+            print(f"Error deleting images: {str(e)}")
+            return 0
+    
     @staticmethod
     def _extract_public_id(image_url: str) -> Optional[str]:
         """
@@ -118,13 +355,14 @@ class ImageService:
         
         return None
     
-    def replace_image(self, old_url: Optional[str], new_file: Any) -> Optional[str]:
+    def replace_image(self, old_url: Optional[str], new_file: Any, upload_token: str) -> Optional[str]:
         """
         画像を置き換え（古い画像を削除して新しい画像をアップロード）
         
         Args:
             old_url: 削除する古い画像のURL（Noneの場合は削除スキップ）
             new_file: アップロードする新しいファイル
+            upload_token: 送信ごとのトークン
         
         Returns:
             Optional[str]: 新しい画像のURL、失敗時はNone
@@ -133,10 +371,11 @@ class ImageService:
             Exception: アップロードに失敗した場合
         """
         # 新しい画像をアップロード
-        new_url = self.upload_image(new_file)
+        new_url = self.upload_image(new_file, upload_token)
         
         # アップロード成功後、古い画像を削除
-        if new_url and old_url:
+        # （同じ送信のリトライで同じ画像を再アップロードした場合はpublic_idが同一なので削除しない）
+        if new_url and old_url and self._extract_public_id(new_url) != self._extract_public_id(old_url):
             self.delete_image(old_url)  # 削除失敗は無視
         
         return new_url
@@ -2,20 +2,156 @@
 Manga Service: Business logic for manga CRUD operations
 """
 
+import traceback
+import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 from models.manga import Manga
+from utils.config import Config
+from config.constants import MAGAZINE_NAME_ORDER
 from utils.notion_client import (
     query_notion,
+    iter_query_notion,
     create_notion_page,
     update_notion_page,
-    delete_notion_page
+    delete_notion_page,
+    retrieve_notion_page
 )
+from utils.session import SessionManager
+from utils.script_context import submit_with_script_context
+from utils.snapshot_cache import (
+    SNAPSHOT_REVALIDATE_AFTER,
+    load_snapshot,
+    current_generation,
+    save_snapshot_if_current,
+    delete_snapshot,
+    refresh_snapshot_in_background
+)
+
+# 一覧取得結果のキャッシュ保持時間（秒）
+MANGA_LIST_CACHE_TTL = 300
+
+# 一覧取得で受け取るプロパティ（Mangaが使用するもののみ。旧special_volumes等は取得しない）
+LIST_PROPERTIES = (
+    "title",
+    "title_kana",
+    "magazine_type",
+    "magazine_name",
+    "latest_owned_volume",
+    "latest_released_volume",
+    "is_completed",
+    "image_url",
+    "relation_books_to",
+    "relation_books_from",
+    "latest_release_date",
+    "next_release_date",
+    "missing_volumes",
+    "owned_media",
+    "notes",
+)
+
+
+def _snapshot_name(database_id: str) -> str:
+    return f"books_{database_id}"
+
+
+def _parse_mangas(pages: List[Dict[str, Any]]) -> List[Manga]:
+    """Notionのページ一覧をMangaに変換（解析できないページはスキップ）"""
+    # 通常は一括で変換し、失敗した場合のみページ単位で変換し直す
+    try:
+        return [Manga.from_notion_page(page) for page in pages]
+    except Exception:
+        pass
+    
+    mangas = []
+    for page in pages:
+        try:
+            mangas.append(Manga.from_notion_page(page))
+        except Exception as e:
+            # 個別のページでエラーが発生しても続行
+            print(f"Warning: Failed to parse manga page {page.get('id', 'unknown')}: {e}")
+    return mangas
+
+
+@st.cache_data(ttl=MANGA_LIST_CACHE_TTL, show_spinner="データを読み込み中...")
+def _fetch_all_mangas(api_key: str, database_id: str) -> List[Manga]:
+    """
+    Notionから全漫画を取得してパース（database_idごとにキャッシュ）
+    
+    ディスクにスナップショットがあればそれを即座に返し、古くなっていれば
+    バックグラウンドで再取得する。
+    
+    Args:
+        api_key: Notion API Key
+        database_id: Notion Database ID
+    
+    Returns:
+        List[Manga]: 漫画オブジェクトのリスト
+    """
+    name = _snapshot_name(database_id)
+    snapshot = load_snapshot(name)
+    if snapshot is not None:
+        pages, age = snapshot
+        if age > SNAPSHOT_REVALIDATE_AFTER:
+            refresh_snapshot_in_background(
+                name,
+                lambda: query_notion(database_id, api_key, filter_properties=LIST_PROPERTIES),
+                on_refresh=_invalidate_list_cache
+            )
+        return _parse_mangas(pages)
+    
+    # 取得中に他のセッションで更新（スナップショット削除）があれば、取得結果は保存しない
+    generation = current_generation(name)
+    pages = []
+    mangas = []
+    # 次ページの取得はバックグラウンドで先行実行されるため、解析と通信が重なる
+    for results in iter_query_notion(database_id, api_key, filter_properties=LIST_PROPERTIES):
+        pages.extend(results)
+        mangas.extend(_parse_mangas(results))
+    
+    save_snapshot_if_current(name, pages, generation)
+    return mangas
+
+
+def _load_manga(api_key: str, page_id: str) -> Manga:
+    """Notionから1件の漫画を取得してパース（キャッシュを通さない）"""
+    return Manga.from_notion_page(retrieve_notion_page(page_id, api_key))
+
+
+@st.cache_data(ttl=MANGA_LIST_CACHE_TTL, show_spinner=False)
+def _fetch_manga(api_key: str, page_id: str) -> Manga:
+    """
+    Notionから1件の漫画を取得してパース（page_idごとにキャッシュ）
+    
+    Args:
+        api_key: Notion API Key
+        page_id: Notion Page ID
+    
+    Returns:
+        Manga: 漫画オブジェクト
+    """
+    return _load_manga(api_key, page_id)
+
+
+# 一覧データの世代番号（キャッシュ破棄ごとに進め、各セッションが保持する一覧を無効化する）
+_list_epoch = 0
+
+
+def _invalidate_list_cache() -> None:
+    """漫画一覧・個別取得のメモリキャッシュを破棄"""
+    global _list_epoch
+    _fetch_all_mangas.clear()
+    _fetch_manga.clear()
+    _list_epoch += 1
 
 
 class MangaService:
     """漫画データの取得・作成・更新・削除を行うサービスクラス"""
     
+    # 複数ページ取得用ワーカー（通信待ちが主体のためスレッドで並列化、プロセス全体で共有）
+    _fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="manga-fetch")
+    
     def __init__(self, api_key: str, database_id: str):
         """
         MangaServiceの初期化
@@ -29,7 +165,7 @@ class MangaService:
     
     def get_all_mangas(self) -> List[Manga]:
         """
-        全ての漫画データを取得
+        全ての漫画データを取得（TTL付きキャッシュ）
         
         Returns:
             List[Manga]: 漫画オブジェクトのリスト
@@ -37,41 +173,95 @@ class MangaService:
         Raises:
             Exception: Notion APIでエラーが発生した場合
         """
-        results = query_notion(self.database_id, self.api_key)
-        
-        mangas = []
-        for page in results:
-            try:
-                manga = Manga.from_notion_page(page)
-                mangas.append(manga)
-            except Exception as e:
-                # 個別のページでエラーが発生しても続行
-                print(f"Warning: Failed to parse manga page {page.get('id', 'unknown')}: {e}")
-                continue
-        
+        # 同一セッション内の画面遷移では、キャッシュからの複製（デシリアライズ）も省く
+        epoch = _list_epoch
+        mangas = SessionManager.get_books_cache(MANGA_LIST_CACHE_TTL, epoch)
+        if mangas is None:
+            mangas = _fetch_all_mangas(self.api_key, self.database_id)
+            SessionManager.set_books_cache(mangas, epoch)
         return mangas
     
-    def get_manga_by_id(self, page_id: str) -> Optional[Manga]:
+    def clear_cache(self) -> None:
+        """漫画一覧のキャッシュとスナップショットを破棄（登録・更新・削除後に呼び出す）"""
+        delete_snapshot(_snapshot_name(self.database_id))
+        _invalidate_list_cache()
+    
+    def get_manga_by_id(self, page_id: str, fresh: bool = False) -> Optional[Manga]:
         """
-        指定されたIDの漫画データを取得
+        指定されたIDの漫画データを取得（TTL付きキャッシュ、登録・更新・削除で破棄）
         
         Args:
             page_id: Notion Page ID
+            fresh: Trueの場合はキャッシュを通さずNotionから取得
+                （取得結果を書き戻す更新処理では、Notion上で直接行われた変更を
+                キャッシュの古い内容で上書きしないよう必ず指定する）
         
         Returns:
             Optional[Manga]: 漫画オブジェクト（見つからない場合はNone）
-        
-        Raises:
-            Exception: Notion APIでエラーが発生した場合
         """
         try:
-            from utils.notion_client import retrieve_notion_page
-            page = retrieve_notion_page(page_id, self.api_key)
-            return Manga.from_notion_page(page)
+            if fresh:
+                return _load_manga(self.api_key, page_id)
+            return _fetch_manga(self.api_key, page_id)
         except Exception as e:
             print(f"Error retrieving manga {page_id}: {str(e)}")
             return None
     
+    def find_manga_by_id(self, page_id: str) -> Optional[Manga]:
+        """
+        指定されたIDの漫画データを取得（一覧キャッシュにあれば通信しない）
+        
+        画面遷移時の参照用。一覧を取得済みのセッションでは即座に返し、
+        ない場合のみNotionから取得する
+        
+        Args:
+            page_id: Notion Page ID
+        
+        Returns:
+            Optional[Manga]: 漫画オブジェクト（見つからない場合はNone）
+        """
+        mangas = SessionManager.get_books_cache(MANGA_LIST_CACHE_TTL, _list_epoch)
+        if mangas is not None:
+            manga = next((manga for manga in mangas if manga.id == page_id), None)
+            if manga is not None:
+                return manga
+        return self.get_manga_by_id(page_id)
+    
+    def get_mangas_by_ids(self, page_ids: List[str]) -> List[Manga]:
+        """
+        複数IDの漫画データを並列に取得
+        
+        Args:
+            page_ids: Notion Page IDのリスト
+        
+        Returns:
+            List[Manga]: 取得できた漫画オブジェクトのリスト（page_idsの順序を維持）
+        """
+        # キャッシュ関数を呼び出すため、ワーカースレッドにも実行コンテキストを引き継ぐ
+        futures = [
+            submit_with_script_context(self._fetch_executor, self.get_manga_by_id, page_id)
+            for page_id in page_ids
+        ]
+        mangas = [future.result() for future in futures]
+        return [manga for manga in mangas if manga]
+    
+    def start_fetch(self, page_id: str) -> Future:
+        """
+        漫画詳細の取得をバックグラウンドで開始
+        
+        取得中に呼び出し元で別の処理（リレーション更新など）を進め、
+        必要になった時点で result() で結果を受け取る
+        
+        Args:
+            page_id: 取得する漫画のNotion Page ID
+        
+        Returns:
+            Future: result() でMangaオブジェクト（取得失敗時はNone）を返すFuture
+        """
+        # 結果は画面遷移で一度使うだけなので、キャッシュを通さずに取得する
+        # （ワーカースレッドからキャッシュ関数を呼ばず、並行するキャッシュ破棄とも競合しない）
+        return self._fetch_executor.submit(self.get_manga_by_id, page_id, fresh=True)
+    
     def create_manga(self, manga: Manga) -> str:
         """
         新しい漫画をNotionDBに登録
@@ -87,6 +277,7 @@ class MangaService:
         """
         properties = manga.to_notion_properties()
         result = create_notion_page(self.database_id, properties, self.api_key)
+        self.clear_cache()
         return result["id"]
     
     def update_manga(self, manga: Manga) -> bool:
@@ -106,19 +297,40 @@ class MangaService:
         if not manga.id:
             raise ValueError("Manga ID is required for update operation")
         
+        if not self._update_page(manga):
+            return False
+        self.clear_cache()
+        return True
+    
+    def _update_page(self, manga: Manga) -> bool:
+        """
+        漫画のNotionページを更新（キャッシュは破棄しない）
+        
+        複数ページをまとめて更新する処理で、全ての更新後に一度だけ
+        clear_cache() を呼び出すために使用する
+        
+        Args:
+            manga: 更新する漫画オブジェクト（idフィールド必須）
+        
+        Returns:
+            bool: 更新成功ならTrue、失敗ならFalse
+        """
         properties = manga.to_notion_properties()
         
         try:
-            print(f"Attempting to update manga {manga.id}")
-            print(f"Properties being sent: {properties}")
+            # 正常時の送信内容はデバッグ有効時のみ出力
+            debug = Config.is_debug_enabled()
+            if debug:
+                print(f"Attempting to update manga {manga.id}")
+                print(f"Properties being sent: {properties}")
             update_notion_page(manga.id, properties, self.api_key)
-            print(f"Successfully updated manga {manga.id}")
+            if debug:
+                print(f"Successfully updated manga {manga.id}")
             return True
         except Exception as e:
             print(f"Error updating manga {manga.id}: {str(e)}")
             print(f"Properties being sent: {properties}")
             print(f"Exception type: {type(e)}")
-            import traceback
             print(f"Traceback: {traceback.format_exc()}")
             return False
     
@@ -134,48 +346,67 @@ class MangaService:
         """
         try:
             delete_notion_page(page_id, self.api_key)
+            self.clear_cache()
             return True
         except Exception as e:
             print(f"Error deleting manga {page_id}: {str(e)}")
             return False
 
+    def _remove_child(self, parent_id: str, child_id: str) -> bool:
+        """親作品の子作品リストから指定の作品を削除（変更がない場合もTrue）"""
+        parent = self.get_manga_by_id(parent_id, fresh=True)
+        if not parent or not parent.related_books_from or child_id not in parent.related_books_from:
+            return True
+        parent.related_books_from = [book_id for book_id in parent.related_books_from if book_id != child_id] or None
+        return self._update_page(parent)
+    
+    def _add_child(self, parent_id: str, child_id: str) -> bool:
+        """親作品の子作品リストに指定の作品を追加（変更がない場合もTrue）"""
+        parent = self.get_manga_by_id(parent_id, fresh=True)
+        if not parent:
+            return False
+        children = parent.related_books_from or []
+        if child_id in children:
+            return True
+        parent.related_books_from = children + [child_id]
+        return self._update_page(parent)
+    
     def update_parent_relation(self, manga_id: str, old_parent_id: Optional[str], new_parent_id: Optional[str]) -> bool:
         """
         親子関係の変更時に、関連する作品の双方向リレーションを更新
-
+        
+        旧親・新親は別ページのため、両方の更新を並行して行い、
+        キャッシュは全ての更新が終わった後に呼び出し元のスレッドで一度だけ破棄する
+        
         Args:
             manga_id: 更新対象の漫画ID
             old_parent_id: 以前の親作品ID（Noneの場合は親なし）
             new_parent_id: 新しい親作品ID（Noneの場合は親なし）
-
+        
         Returns:
             bool: 更新成功ならTrue、失敗ならFalse
         """
-        try:
-            # 古い親作品から子作品リストを削除
-            if old_parent_id:
-                old_parent = self.get_manga_by_id(old_parent_id)
-                if old_parent and old_parent.related_books_from:
-                    # 自分を子作品リストから削除
-                    updated_children = [child_id for child_id in old_parent.related_books_from if child_id != manga_id]
-                    old_parent.related_books_from = updated_children if updated_children else None
-                    self.update_manga(old_parent)
-
-            # 新しい親作品に子作品を追加
-            if new_parent_id:
-                new_parent = self.get_manga_by_id(new_parent_id)
-                if new_parent:
-                    # 子作品リストに自分を追加
-                    current_children = new_parent.related_books_from or []
-                    if manga_id not in current_children:
-                        current_children.append(manga_id)
-                    new_parent.related_books_from = current_children
-                    self.update_manga(new_parent)
-
+        if old_parent_id == new_parent_id:
             return True
-        except Exception as e:
-            print(f"Error updating parent relation for manga {manga_id}: {str(e)}")
-            return False    @staticmethod
+        
+        futures = []
+        if old_parent_id:
+            futures.append(self._fetch_executor.submit(self._remove_child, old_parent_id, manga_id))
+        if new_parent_id:
+            futures.append(self._fetch_executor.submit(self._add_child, new_parent_id, manga_id))
+        
+        success = True
+        for future in futures:
+            try:
+                success = future.result() and success
+            except Exception as e:
+                print(f"Error updating parent relation for manga {manga_id}: {str(e)}")
+                success = False
+        
+        self.clear_cache()
+        return success
+    
+    @staticmethod
     def group_by_magazine(mangas: List[Manga]) -> Dict[str, Dict[str, List[Manga]]]:
         """
         漫画リストを雑誌タイプ→雑誌名でグループ化
@@ -210,15 +441,7 @@ class MangaService:
         Returns:
             List[str]: ソート済みの雑誌名リスト
         """
-        # 雑誌タイプごとの表示順序定義
-        magazine_name_order = {
-            "ジャンプ": ["週刊少年ジャンプ", "週刊ヤングジャンプ", "ジャンプ+", "ジャンプSQ", "ジャンプGIGA"],
-            "マガジン": ["週刊少年マガジン", "週刊ヤングマガジン", "月刊少年マガジン", "別冊少年マガジン"],
-            "サンデー": ["週刊少年サンデー", "少年サンデーＳ（スーパー）", "裏サンデー"],
-            "その他": ["週刊ビッグコミックスピリッツ", "月刊コミックゼノン", "月刊アフタヌーン"]
-        }
-        
-        defined_order = magazine_name_order.get(magazine_type, [])
+        defined_order = MAGAZINE_NAME_ORDER.get(magazine_type, ())
         
         # 定義済みの順序に従って並び替え
         sorted_names = []
@@ -232,46 +455,6 @@ class MangaService:
         
         return sorted_names
     
-    def update_parent_relation(
-        self,
-        manga_id: str,
-        old_parent_id: str = None,
-        new_parent_id: str = None
-    ) -> None:
-        """
-        親作品との関係を更新（簡易版）
-        
-        Args:
-            manga_id: 対象の漫画ID
-            old_parent_id: 変更前の親作品ID
-            new_parent_id: 変更後の親作品ID
-        """
-        # 古い親から自分を削除
-        if old_parent_id:
-            try:
-                old_parent = self.get_manga_by_id(old_parent_id)
-                if old_parent and old_parent.related_books_from:
-                    if manga_id in old_parent.related_books_from:
-                        old_parent.related_books_from.remove(manga_id)
-                        if not old_parent.related_books_from:
-                            old_parent.related_books_from = None
-                        self.update_manga(old_parent)
-            except Exception as e:
-                print(f"Warning: Failed to remove from old parent {old_parent_id}: {e}")
-        
-        # 新しい親に自分を追加
-        if new_parent_id:
-            try:
-                new_parent = self.get_manga_by_id(new_parent_id)
-                if new_parent:
-                    if new_parent.related_books_from is None:
-                        new_parent.related_books_from = []
-                    if manga_id not in new_parent.related_books_from:
-                        new_parent.related_books_from.append(manga_id)
-                        self.update_manga(new_parent)
-            except Exception as e:
-                print(f"Warning: Failed to add to new parent {new_parent_id}: {e}")
-    
     def update_series_relations(
         self, 
         created_manga_id: str, 
@@ -289,7 +472,7 @@ class MangaService:
         # 親作品がある場合、親のrelated_books_fromに新しい作品を追加
         if parent_id:
             try:
-                parent_manga = self.get_manga_by_id(parent_id)
+                parent_manga = self.get_manga_by_id(parent_id, fresh=True)
                 if parent_manga:
                     if parent_manga.related_books_from is None:
                         parent_manga.related_books_from = []
@@ -304,7 +487,7 @@ class MangaService:
         if children_ids:
             for child_id in children_ids:
                 try:
-                    child_manga = self.get_manga_by_id(child_id)
+                    child_manga = self.get_manga_by_id(child_id, fresh=True)
                     if child_manga:
                         # 子は一つの親しか持てないので、リストを置き換え
                         child_manga.related_books_to = [created_manga_id]
@@ -339,13 +522,8 @@ class MangaService:
         
         # 子作品を取得
         if manga.related_books_from:
-            for child_id in manga.related_books_from:
-                try:
-                    child = self.get_manga_by_id(child_id)
-                    if child:
-                        children.append(child)
-                except Exception as e:
-                    print(f"Warning: Failed to get child {child_id} for {manga.id}: {e}")
+            # 子作品は並列に取得（取得失敗はget_manga_by_id内でNoneとなり除外される）
+            children = self.get_mangas_by_ids(manga.related_books_from)
         
         is_series_root = parent is None and len(children) > 0
         
@@ -383,7 +561,7 @@ class MangaService:
             # 古い親から自分を削除
             if old_parent_id:
                 try:
-                    old_parent = self.get_manga_by_id(old_parent_id)
+                    old_parent = self.get_manga_by_id(old_parent_id, fresh=True)
                     if old_parent and old_parent.related_books_from:
                         if manga_id in old_parent.related_books_from:
                             old_parent.related_books_from.remove(manga_id)
@@ -394,7 +572,7 @@ class MangaService:
             # 新しい親に自分を追加
             if new_parent_id:
                 try:
-                    new_parent = self.get_manga_by_id(new_parent_id)
+                    new_parent = self.get_manga_by_id(new_parent_id, fresh=True)
                     if new_parent:
                         if new_parent.related_books_from is None:
                             new_parent.related_books_from = []
@@ -412,7 +590,7 @@ class MangaService:
         removed_children = old_children_set - new_children_set
         for child_id in removed_children:
             try:
-                child = self.get_manga_by_id(child_id)
+                child = self.get_manga_by_id(child_id, fresh=True)
                 if child and child.related_books_to:
                     if manga_id in child.related_books_to:
                         child.related_books_to.remove(manga_id)
@@ -427,7 +605,7 @@ class MangaService:
         added_children = new_children_set - old_children_set
         for child_id in added_children:
             try:
-                child = self.get_manga_by_id(child_id)
+                child = self.get_manga_by_id(child_id, fresh=True)
                 if child:
                     # 子は一つの親しか持てないので、リストを置き換え
                     child.related_books_to = [manga_id]
@@ -2,15 +2,120 @@
 Special Volume Service: 特殊巻のCRUD操作
 """
 
+import streamlit as st
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
 from collections import defaultdict
-from utils.notion_client import query_notion, create_notion_page, update_notion_page, delete_notion_page
+from utils.notion_client import query_notion, iter_query_notion, create_notion_page, update_notion_page, delete_notion_page, retrieve_notion_page
+from utils.session import SessionManager
+from utils.script_context import submit_with_script_context
+from utils.snapshot_cache import (
+    SNAPSHOT_REVALIDATE_AFTER,
+    load_snapshot,
+    current_generation,
+    save_snapshot_if_current,
+    delete_snapshot,
+    refresh_snapshot_in_background
+)
 from models.special_volume import SpecialVolume
 
+# 一覧取得結果のキャッシュ保持時間（秒）
+SPECIAL_VOLUME_LIST_CACHE_TTL = 300
+
+
+# 一覧取得で受け取るプロパティ（SpecialVolumeが使用するもののみ）
+LIST_PROPERTIES = ("title", "book", "sort_order", "type", "image_url")
+
+# 一覧取得時の並び順（sort_order昇順）
+_LIST_SORTS = [{"property": "sort_order", "direction": "ascending"}]
+
+
+def _snapshot_name(database_id: str) -> str:
+    return f"special_volumes_{database_id}"
+
+
+def _query_special_volume_pages(api_key: str, database_id: str) -> List[Dict[str, Any]]:
+    """sort_order順に全特殊巻のページを取得"""
+    return query_notion(database_id, api_key, sorts=_LIST_SORTS, filter_properties=LIST_PROPERTIES)
+
+
+def _parse_special_volumes(results: List[Dict[str, Any]]) -> List[SpecialVolume]:
+    """Notionのページ一覧をSpecialVolumeに変換（解析できないページはスキップ）"""
+    # 通常は一括で変換し、失敗した場合のみページ単位で変換し直す
+    try:
+        return [SpecialVolume.from_notion_page(result) for result in results]
+    except Exception:
+        pass
+    
+    special_volumes = []
+    for result in results:
+        try:
+            special_volume = SpecialVolume.from_notion_page(result)
+            special_volumes.append(special_volume)
+        except Exception as e:
+            print(f"Error parsing special volume: {e}")
+            continue
+    
+    return special_volumes
+
+
+@st.cache_data(ttl=SPECIAL_VOLUME_LIST_CACHE_TTL, show_spinner=False)
+def _fetch_all_special_volumes(api_key: str, database_id: str) -> List[SpecialVolume]:
+    """
+    Notionから全特殊巻を取得してパース（database_idごとにキャッシュ）
+    
+    ディスクにスナップショットがあればそれを即座に返し、古くなっていれば
+    バックグラウンドで再取得する。
+    
+    Args:
+        api_key: Notion API キー
+        database_id: 特殊巻データベースID
+    
+    Returns:
+        List[SpecialVolume]: 特殊巻リスト（sort_order順）
+    """
+    name = _snapshot_name(database_id)
+    snapshot = load_snapshot(name)
+    if snapshot is not None:
+        results, age = snapshot
+        if age > SNAPSHOT_REVALIDATE_AFTER:
+            refresh_snapshot_in_background(
+                name,
+                lambda: _query_special_volume_pages(api_key, database_id),
+                on_refresh=_invalidate_list_cache
+            )
+        return _parse_special_volumes(results)
+    
+    # 取得中に他のセッションで更新（スナップショット削除）があれば、取得結果は保存しない
+    generation = current_generation(name)
+    results = []
+    special_volumes = []
+    # 次ページの取得はバックグラウンドで先行実行されるため、解析と通信が重なる
+    for batch in iter_query_notion(database_id, api_key, sorts=_LIST_SORTS, filter_properties=LIST_PROPERTIES):
+        results.extend(batch)
+        special_volumes.extend(_parse_special_volumes(batch))
+    
+    save_snapshot_if_current(name, results, generation)
+    return special_volumes
+
+
+# 一覧データの世代番号（キャッシュ破棄ごとに進め、各セッションが保持するグループ化済み一覧を無効化する）
+_list_epoch = 0
+
+
+def _invalidate_list_cache() -> None:
+    """特殊巻一覧のメモリキャッシュを破棄"""
+    global _list_epoch
+    _fetch_all_special_volumes.clear()
+    _list_epoch += 1
+
 
 class SpecialVolumeService:
     """特殊巻のCRUD操作を提供するサービスクラス"""
     
+    # 一覧の先読み用ワーカー（プロセス全体で共有）
+    _prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="special-volume-prefetch")
+    
     def __init__(self, api_key: str, database_id: str):
         """
         SpecialVolumeServiceの初期化
@@ -25,7 +130,7 @@ class SpecialVolumeService:
     
     def get_all_special_volumes(self) -> List[SpecialVolume]:
         """
-        全ての特殊巻を取得（sort_order順）
+        全ての特殊巻を取得（sort_order順、TTL付きキャッシュ）
         
         Returns:
             List[SpecialVolume]: 特殊巻リスト
@@ -34,25 +139,16 @@ class SpecialVolumeService:
             Exception: データベース接続エラー
         """
         try:
-            # sort_orderでソートしてクエリ
-            sorts = [{"property": "sort_order", "direction": "ascending"}]
-            results = query_notion(self.database_id, self.api_key, sorts=sorts)
-            
-            special_volumes = []
-            for result in results:
-                try:
-                    special_volume = SpecialVolume.from_notion_page(result)
-                    special_volumes.append(special_volume)
-                except Exception as e:
-                    print(f"Error parsing special volume: {e}")
-                    continue
-            
-            return special_volumes
-            
+            return _fetch_all_special_volumes(self.api_key, self.database_id)
         except Exception as e:
             print(f"Error fetching special volumes: {str(e)}")
             raise
     
+    def clear_cache(self) -> None:
+        """特殊巻一覧のキャッシュとスナップショットを破棄（作成・更新・削除後に呼び出す）"""
+        delete_snapshot(_snapshot_name(self.database_id))
+        _invalidate_list_cache()
+    
     def get_special_volumes_by_book_id(self, book_id: str) -> List[SpecialVolume]:
         """
         指定された本IDに関連する特殊巻を取得
@@ -72,48 +168,61 @@ class SpecialVolumeService:
                 }
             }
             
-            # sort_orderでソート
-            sorts = [{"property": "sort_order", "direction": "ascending"}]
-            
+            # sort_orderでソート（一覧取得と同じ並び順の定数を使用）
             results = query_notion(
                 self.database_id, 
                 self.api_key, 
                 filter=filters, 
-                sorts=sorts
+                sorts=_LIST_SORTS,
+                filter_properties=LIST_PROPERTIES
             )
             
-            special_volumes = []
-            for result in results:
-                try:
-                    special_volume = SpecialVolume.from_notion_page(result)
-                    special_volumes.append(special_volume)
-                except Exception as e:
-                    print(f"Error parsing special volume: {e}")
-                    continue
-            
-            return special_volumes
+            return _parse_special_volumes(results)
             
         except Exception as e:
             print(f"Error fetching special volumes for book {book_id}: {str(e)}")
             return []
     
-    def get_all_special_volumes_grouped_by_book(self) -> Dict[str, List[SpecialVolume]]:
+    def start_prefetch(self) -> Optional[Future]:
+        """
+        全特殊巻の取得をバックグラウンドで開始（セッションキャッシュがある場合は何もしない）
+        
+        漫画一覧の取得と並行して実行し、結果は
+        get_all_special_volumes_grouped_by_book(prefetch=...) に渡して利用する
+        
+        Returns:
+            Optional[Future]: get_all_special_volumes の結果を返すFuture、キャッシュ済みならNone
+        """
+        if SessionManager.get_special_volumes_cache(_list_epoch) is not None:
+            return None
+        # キャッシュ関数を呼び出すため、ワーカースレッドにも実行コンテキストを引き継ぐ
+        return submit_with_script_context(self._prefetch_executor, self.get_all_special_volumes)
+    
+    def get_all_special_volumes_grouped_by_book(
+        self,
+        prefetch: Optional[Future] = None
+    ) -> Dict[str, List[SpecialVolume]]:
         """
         全ての特殊巻を取得してbook_id別にグループ化（キャッシュ付き）
         
+        Args:
+            prefetch: start_prefetch で開始した取得処理（指定時はその結果を使用）
+        
         Returns:
             Dict[str, List[SpecialVolume]]: {book_id: [SpecialVolume, ...]} 形式
         """
-        from utils.session import SessionManager
-        
-        # キャッシュがある場合はそれを返す
-        cached_data = SessionManager.get_special_volumes_cache()
+        # キャッシュがある場合はそれを返す（バックグラウンド再取得などで世代が進んでいれば作り直す）
+        epoch = _list_epoch
+        cached_data = SessionManager.get_special_volumes_cache(epoch)
         if cached_data is not None:
             return cached_data
         
         try:
-            # 全特殊巻を一度に取得
-            all_special_volumes = self.get_all_special_volumes()
+            # 全特殊巻を一度に取得（先読み済みならその結果を待つ）
+            if prefetch is not None:
+                all_special_volumes = prefetch.result()
+            else:
+                all_special_volumes = self.get_all_special_volumes()
             
             # book_id別にグループ化
             grouped = defaultdict(list)
@@ -123,7 +232,7 @@ class SpecialVolumeService:
             
             # 辞書型に変換してキャッシュに保存
             result = dict(grouped)
-            SessionManager.set_special_volumes_cache(result)
+            SessionManager.set_special_volumes_cache(result, epoch)
             
             return result
             
@@ -141,10 +250,8 @@ class SpecialVolumeService:
         Returns:
             int: 特殊巻の数
         """
-        from utils.session import SessionManager
-        
         # キャッシュから直接取得を試行
-        cached_count = SessionManager.get_special_volume_count_for_book(book_id)
+        cached_count = SessionManager.get_special_volume_count_for_book(book_id, _list_epoch)
         if cached_count is not None:
             return cached_count
         
@@ -163,7 +270,6 @@ class SpecialVolumeService:
             Optional[SpecialVolume]: 特殊巻オブジェクト、見つからない場合はNone
         """
         try:
-            from utils.notion_client import retrieve_notion_page
             response = retrieve_notion_page(special_volume_id, self.api_key)
             return SpecialVolume.from_notion_page(response)
         except Exception as e:
@@ -186,6 +292,7 @@ class SpecialVolumeService:
         try:
             properties = special_volume.to_notion_properties()
             response = create_notion_page(self.database_id, properties, self.api_key)
+            self.clear_cache()
             return response.get("id")
         except Exception as e:
             print(f"Error creating special volume: {str(e)}")
@@ -207,6 +314,7 @@ class SpecialVolumeService:
         try:
             properties = special_volume.to_notion_properties()
             update_notion_page(special_volume.id, properties, self.api_key)
+            self.clear_cache()
             return True
         except Exception as e:
             print(f"Error updating special volume {special_volume.id}: {str(e)}")
@@ -224,6 +332,7 @@ class SpecialVolumeService:
         """
         try:
             delete_notion_page(special_volume_id, self.api_key)
+            self.clear_cache()
             return True
         except Exception as e:
             print(f"Error deleting special volume {special_volume_id}: {str(e)}")
@@ -6,8 +6,12 @@ from .config import Config
 from .session import SessionManager
 from .css_loader import load_custom_styles
 from .kana_converter import title_to_kana
+from .image_url import thumbnail_url, detail_image_url, lqip_url
+from .grid import chunked
+from .script_context import submit_with_script_context
 from .notion_client import (
     query_notion,
+    iter_query_notion,
     create_notion_page,
     update_notion_page,
     retrieve_notion_page,
@@ -19,7 +23,13 @@ __all__ = [
     'SessionManager',
     'load_custom_styles',
     'title_to_kana',
+    'thumbnail_url',
+    'detail_image_url',
+    'lqip_url',
+    'chunked',
+    'submit_with_script_context',
     'query_notion',
+    'iter_query_notion',
     'create_notion_page',
     'update_notion_page',
     'retrieve_notion_page',
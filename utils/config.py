@@ -1,26 +1,29 @@
 """アプリケーション設定管理"""
 import streamlit as st
 import os
+from functools import lru_cache
+from types import MappingProxyType
 
 class Config:
     """設定クラス - Notion/Cloudinary/OpenAIの設定を管理"""
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def load_notion_config():
-        """Notion設定を読み込み
+        """Notion設定を読み込み（プロセス内で一度だけ読み込んでキャッシュ）
         
         Returns:
-            dict: api_key と 2つのdatabase_id を含む辞書
+            MappingProxyType: api_key と 2つのdatabase_id を含む読み取り専用の辞書
             
         Raises:
             SystemExit: 設定が見つからない場合
         """
         try:
-            return {
+            return MappingProxyType({
                 "api_key": st.secrets["notion"]["api_key"],
                 "books_database_id": st.secrets["notion"]["books_database_id"],
                 "special_volumes_database_id": st.secrets["notion"]["special_volumes_database_id"]
-            }
+            })
         except Exception as e:
             st.error(f"🔧 **Notion設定エラー**: {str(e)}")
             st.markdown("""
@@ -38,18 +41,19 @@ class Config:
             st.stop()
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def load_cloudinary_config():
-        """Cloudinary設定を読み込み
+        """Cloudinary設定を読み込み（プロセス内で一度だけ読み込んでキャッシュ）
         
         Returns:
-            dict or None: 設定が存在する場合は辞書、ない場合はNone
+            MappingProxyType or None: 設定が存在する場合は読み取り専用の辞書、ない場合はNone
         """
         try:
-            return {
+            return MappingProxyType({
                 "cloud_name": st.secrets["cloudinary"]["cloud_name"],
                 "api_key": st.secrets["cloudinary"]["api_key"],
                 "api_secret": st.secrets["cloudinary"]["api_secret"]
-            }
+            })
         except:
             return None
     
@@ -66,14 +70,14 @@ class Config:
             return None
     
     @staticmethod
-    def check_cloudinary_available():
-        """Cloudinaryライブラリが利用可能かチェック
+    @lru_cache(maxsize=1)
+    def is_debug_enabled() -> bool:
+        """デバッグ出力が有効かを取得（secrets.tomlの [debug] enabled = true で有効化）
         
         Returns:
-            bool: 利用可能な場合True
+            bool: 有効な場合True（未設定の場合はFalse）
         """
         try:
-            import cloudinary
-            return True
-        except ImportError:
+            return bool(st.secrets.get("debug", {}).get("enabled", False))
+        except:
             return False
@@ -3,33 +3,84 @@ CSS読み込み用のユーティリティ関数
 """
 import streamlit as st
 import os
+import re
 
-def load_css(file_name):
+# CSS縮小用の正規表現（コメント・連続する空白・区切り記号前後の空白）
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_DELIMITER_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+
+def _minify_css(css):
     """
-    CSSファイルを読み込んでStreamlitに適用する
+    CSSからコメントと不要な空白を取り除く
+    
+    スタイルは再実行のたびにブラウザへ送信されるため、送信量を減らす
+    
+    Args:
+        css (str): CSSの内容
+    
+    Returns:
+        str: 縮小後のCSS
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    return _CSS_DELIMITER_SPACE_RE.sub(r"\1", css).strip()
+
+@st.cache_data(show_spinner=False)
+def _read_css(css_file_path, mtime):
+    """
+    CSSファイルの内容を読み込んで縮小する（パスと更新時刻をキーにキャッシュ）
+    
+    Args:
+        css_file_path (str): CSSファイルのパス
+        mtime (float): ファイルの更新時刻（変更時にキャッシュを無効化するため）
+    
+    Returns:
+        str: 縮小後のCSSの内容
+    """
+    with open(css_file_path, "r", encoding="utf-8") as f:
+        return _minify_css(f.read())
+
+def _get_css(file_name):
+    """
+    staticディレクトリ内のCSSを取得（読み込みエラー時は画面に表示してNoneを返す）
     
     Args:
         file_name (str): CSSファイル名（staticディレクトリ内）
+    
+    Returns:
+        str or None: CSSの内容
     """
     css_file_path = os.path.join("static", file_name)
     
     try:
-        with open(css_file_path, "r", encoding="utf-8") as f:
-            css = f.read()
-        
-        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-        
+        return _read_css(css_file_path, os.path.getmtime(css_file_path))
     except FileNotFoundError:
         st.error(f"CSSファイルが見つかりません: {css_file_path}")
     except Exception as e:
         st.error(f"CSSファイルの読み込みでエラーが発生しました: {str(e)}")
+    return None
+
+def load_css(*file_names):
+    """
+    CSSファイルを読み込んでStreamlitに適用する
+    
+    複数ファイルを指定した場合は1つの<style>要素にまとめて出力する。
+    Streamlitは再実行時に出力されなかった要素を削除するため、
+    スタイルの出力自体は毎回行い、ファイル読み込みのみキャッシュする。
+    
+    Args:
+        *file_names (str): CSSファイル名（staticディレクトリ内）
+    """
+    css_list = [css for css in map(_get_css, file_names) if css]
+    if css_list:
+        st.markdown(f"<style>{''.join(css_list)}</style>", unsafe_allow_html=True)
 
 def load_custom_styles():
     """
     アプリケーション全体で使用するカスタムスタイルを読み込む
     """
-    load_css("styles.css")
-    load_css("default.css")
+    load_css("styles.css", "default.css")
 
 def load_page_styles(page_name):
     """
@@ -0,0 +1,18 @@
+"""
+グリッド表示用ユーティリティ
+"""
+from itertools import islice
+
+def chunked(items, size):
+    """
+    シーケンスを指定サイズごとの行に分割する
+    
+    Args:
+        items (Iterable): 分割する要素
+        size (int): 1行あたりの要素数
+    
+    Returns:
+        Iterator[list]: size件ずつのリスト（最後の行は不足分を含まない）
+    """
+    iterator = iter(items)
+    return iter(lambda: list(islice(iterator, size)), [])
@@ -0,0 +1,65 @@
+"""
+画像URL変換ユーティリティ
+Cloudinaryのオンザフライ変換を利用して、表示サイズに合わせた画像URLを生成する
+"""
+
+# 一覧カード用サムネイルのサイズ（px）
+THUMBNAIL_WIDTH = 400
+THUMBNAIL_HEIGHT = 600
+
+# 詳細画面用の画像サイズ（px。表示幅300pxを高解像度ディスプレイでも鮮明に表示できる大きさ）
+DETAIL_IMAGE_WIDTH = 600
+DETAIL_IMAGE_HEIGHT = 900
+
+# 読み込み中に表示するぼかしプレースホルダー（LQIP）の変換
+LQIP_TRANSFORMATION = "w_20,e_blur:1000,q_auto,f_auto"
+
+def _is_cloudinary_url(url):
+    """CloudinaryのアップロードURLかどうか"""
+    return bool(url) and "res.cloudinary.com" in url and "/upload/" in url
+
+def thumbnail_url(url, width=THUMBNAIL_WIDTH, height=THUMBNAIL_HEIGHT):
+    """
+    Cloudinary画像URLをサムネイル用の変換URLに書き換える
+    
+    縦横比を保ったまま指定サイズ以内に縮小し（c_limit）、
+    ブラウザに応じた形式・画質で配信させる（f_auto, q_auto）。
+    Cloudinary以外のURLやNoneはそのまま返す。
+    
+    Args:
+        url (str): 元の画像URL
+        width (int): 最大幅
+        height (int): 最大高さ
+    
+    Returns:
+        str: 変換後の画像URL
+    """
+    if not _is_cloudinary_url(url):
+        return url
+    return url.replace("/upload/", f"/upload/w_{width},h_{height},c_limit,f_auto,q_auto/", 1)
+
+def detail_image_url(url):
+    """
+    Cloudinary画像URLを詳細画面用の変換URLに書き換える
+    
+    Args:
+        url (str): 元の画像URL
+    
+    Returns:
+        str: 変換後の画像URL（Cloudinary以外のURLやNoneはそのまま）
+    """
+    return thumbnail_url(url, DETAIL_IMAGE_WIDTH, DETAIL_IMAGE_HEIGHT)
+
+def lqip_url(url):
+    """
+    Cloudinary画像URLから低画質のぼかしプレースホルダー画像のURLを生成する
+    
+    Args:
+        url (str): 元の画像URL
+    
+    Returns:
+        str or None: プレースホルダー画像のURL（Cloudinary以外のURLはNone）
+    """
+    if not _is_cloudinary_url(url):
+        return None
+    return url.replace("/upload/", f"/upload/{LQIP_TRANSFORMATION}/", 1)
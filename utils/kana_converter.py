@@ -7,10 +7,61 @@ AI（LLM）を使用してより正確な変換も可能
 import unicodedata
 import re
 import os
+from functools import lru_cache
 
 _kakasi_instance = None
 _cutlet_instance = None
 
+# 変換で使用する正規表現（呼び出しごとのコンパイル・キャッシュ参照を省く）
+_LATIN_RE = re.compile(r'[a-zA-Z]+')
+_NON_HIRAGANA_RE = re.compile(r'[^\u3040-\u309F]')
+
+# ローマ字→ひらがな変換テーブル（呼び出しごとに生成しないようモジュールで一度だけ定義）
+_ROMAJI_MAP = {
+    # 4文字のローマ字
+    'tchi': 'っち',
+    # 3文字のローマ字（長い方から優先）
+    'kya': 'きゃ', 'kyu': 'きゅ', 'kyo': 'きょ',
+    'sha': 'しゃ', 'shu': 'しゅ', 'sho': 'しょ', 'shi': 'し',
+    'cha': 'ちゃ', 'chu': 'ちゅ', 'cho': 'ちょ', 'chi': 'ち',
+    'nya': 'にゃ', 'nyu': 'にゅ', 'nyo': 'にょ',
+    'hya': 'ひゃ', 'hyu': 'ひゅ', 'hyo': 'ひょ',
+    'mya': 'みゃ', 'myu': 'みゅ', 'myo': 'みょ',
+    'rya': 'りゃ', 'ryu': 'りゅ', 'ryo': 'りょ',
+    'gya': 'ぎゃ', 'gyu': 'ぎゅ', 'gyo': 'ぎょ',
+    'jya': 'じゃ', 'jyu': 'じゅ', 'jyo': 'じょ',
+    'bya': 'びゃ', 'byu': 'びゅ', 'byo': 'びょ',
+    'pya': 'ぴゃ', 'pyu': 'ぴゅ', 'pyo': 'ぴょ',
+    'tsu': 'つ', 'dzu': 'づ',
+    'tth': 'っす', 'cch': 'っち', 'cck': 'っく',
+    # 2文字のローマ字
+    'ka': 'か', 'ki': 'き', 'ku': 'く', 'ke': 'け', 'ko': 'こ',
+    'sa': 'さ', 'si': 'し', 'su': 'す', 'se': 'せ', 'so': 'そ',
+    'ta': 'た', 'ti': 'ち', 'tu': 'つ', 'te': 'て', 'to': 'と',
+    'na': 'な', 'ni': 'に', 'nu': 'ぬ', 'ne': 'ね', 'no': 'の',
+    'ha': 'は', 'hi': 'ひ', 'hu': 'ふ', 'fu': 'ふ', 'he': 'へ', 'ho': 'ほ',
+    'ma': 'ま', 'mi': 'み', 'mu': 'む', 'me': 'め', 'mo': 'も',
+    'ya': 'や', 'yi': 'い', 'yu': 'ゆ', 'ye': 'いぇ', 'yo': 'よ',
+    'ra': 'ら', 'ri': 'り', 'ru': 'る', 're': 'れ', 'ro': 'ろ',
+    'la': 'ら', 'li': 'り', 'lu': 'る', 'le': 'れ', 'lo': 'ろ',
+    'wa': 'わ', 'wi': 'うぃ', 'wu': 'う', 'we': 'うぇ', 'wo': 'を',
+    'ga': 'が', 'gi': 'ぎ', 'gu': 'ぐ', 'ge': 'げ', 'go': 'ご',
+    'za': 'ざ', 'zi': 'じ', 'zu': 'ず', 'ze': 'ぜ', 'zo': 'ぞ',
+    'ja': 'じゃ', 'ji': 'じ', 'ju': 'じゅ', 'je': 'じぇ', 'jo': 'じょ',
+    'da': 'だ', 'di': 'ぢ', 'du': 'づ', 'de': 'で', 'do': 'ど',
+    'ba': 'ば', 'bi': 'び', 'bu': 'ぶ', 'be': 'べ', 'bo': 'ぼ',
+    'pa': 'ぱ', 'pi': 'ぴ', 'pu': 'ぷ', 'pe': 'ぺ', 'po': 'ぽ',
+    'va': 'ゔぁ', 'vi': 'ゔぃ', 'vu': 'ゔ', 've': 'ゔぇ', 'vo': 'ゔぉ',
+    'fa': 'ふぁ', 'fi': 'ふぃ', 'fe': 'ふぇ', 'fo': 'ふぉ',
+    # 英語でよく使われる組み合わせ
+    'th': 'す', 'dh': 'ず', 'ng': 'んぐ',
+    # 1文字
+    'a': 'あ', 'i': 'い', 'u': 'う', 'e': 'え', 'o': 'お',
+    'n': 'ん', 'l': 'る', 'r': 'る', 'v': 'ゔ', 'f': 'ふ',
+    'x': 'くす', 'q': 'く', 'c': 'く', 'd': 'ど', 'g': 'ぐ',
+    'b': 'ぶ', 'p': 'ぷ', 's': 'す', 't': 'と', 'y': 'い', 'w': 'う',
+}
+
 def get_kakasi():
     """pykakasiインスタンスをシングルトンで取得"""
     global _kakasi_instance
@@ -40,52 +91,6 @@ def romaji_to_hiragana(text: str) -> str:
     ローマ字をひらがなに変換する
     英語の単語も可能な限り日本語発音に近づける
     """
-    # ローマ字→ひらがな変換テーブル
-    romaji_map = {
-        # 4文字のローマ字
-        'tchi': 'っち',
-        # 3文字のローマ字（長い方から優先）
-        'kya': 'きゃ', 'kyu': 'きゅ', 'kyo': 'きょ',
-        'sha': 'しゃ', 'shu': 'しゅ', 'sho': 'しょ', 'shi': 'し',
-        'cha': 'ちゃ', 'chu': 'ちゅ', 'cho': 'ちょ', 'chi': 'ち',
-        'nya': 'にゃ', 'nyu': 'にゅ', 'nyo': 'にょ',
-        'hya': 'ひゃ', 'hyu': 'ひゅ', 'hyo': 'ひょ',
-        'mya': 'みゃ', 'myu': 'みゅ', 'myo': 'みょ',
-        'rya': 'りゃ', 'ryu': 'りゅ', 'ryo': 'りょ',
-        'gya': 'ぎゃ', 'gyu': 'ぎゅ', 'gyo': 'ぎょ',
-        'jya': 'じゃ', 'jyu': 'じゅ', 'jyo': 'じょ',
-        'bya': 'びゃ', 'byu': 'びゅ', 'byo': 'びょ',
-        'pya': 'ぴゃ', 'pyu': 'ぴゅ', 'pyo': 'ぴょ',
-        'tsu': 'つ', 'dzu': 'づ',
-        'tth': 'っす', 'cch': 'っち', 'cck': 'っく',
-        # 2文字のローマ字
-        'ka': 'か', 'ki': 'き', 'ku': 'く', 'ke': 'け', 'ko': 'こ',
-        'sa': 'さ', 'si': 'し', 'su': 'す', 'se': 'せ', 'so': 'そ',
-        'ta': 'た', 'ti': 'ち', 'tu': 'つ', 'te': 'て', 'to': 'と',
-        'na': 'な', 'ni': 'に', 'nu': 'ぬ', 'ne': 'ね', 'no': 'の',
-        'ha': 'は', 'hi': 'ひ', 'hu': 'ふ', 'fu': 'ふ', 'he': 'へ', 'ho': 'ほ',
-        'ma': 'ま', 'mi': 'み', 'mu': 'む', 'me': 'め', 'mo': 'も',
-        'ya': 'や', 'yi': 'い', 'yu': 'ゆ', 'ye': 'いぇ', 'yo': 'よ',
-        'ra': 'ら', 'ri': 'り', 'ru': 'る', 're': 'れ', 'ro': 'ろ',
-        'la': 'ら', 'li': 'り', 'lu': 'る', 'le': 'れ', 'lo': 'ろ',
-        'wa': 'わ', 'wi': 'うぃ', 'wu': 'う', 'we': 'うぇ', 'wo': 'を',
-        'ga': 'が', 'gi': 'ぎ', 'gu': 'ぐ', 'ge': 'げ', 'go': 'ご',
-        'za': 'ざ', 'zi': 'じ', 'zu': 'ず', 'ze': 'ぜ', 'zo': 'ぞ',
-        'ja': 'じゃ', 'ji': 'じ', 'ju': 'じゅ', 'je': 'じぇ', 'jo': 'じょ',
-        'da': 'だ', 'di': 'ぢ', 'du': 'づ', 'de': 'で', 'do': 'ど',
-        'ba': 'ば', 'bi': 'び', 'bu': 'ぶ', 'be': 'べ', 'bo': 'ぼ',
-        'pa': 'ぱ', 'pi': 'ぴ', 'pu': 'ぷ', 'pe': 'ぺ', 'po': 'ぽ',
-        'va': 'ゔぁ', 'vi': 'ゔぃ', 'vu': 'ゔ', 've': 'ゔぇ', 'vo': 'ゔぉ',
-        'fa': 'ふぁ', 'fi': 'ふぃ', 'fe': 'ふぇ', 'fo': 'ふぉ',
-        # 英語でよく使われる組み合わせ
-        'th': 'す', 'dh': 'ず', 'ng': 'んぐ',
-        # 1文字
-        'a': 'あ', 'i': 'い', 'u': 'う', 'e': 'え', 'o': 'お',
-        'n': 'ん', 'l': 'る', 'r': 'る', 'v': 'ゔ', 'f': 'ふ',
-        'x': 'くす', 'q': 'く', 'c': 'く', 'd': 'ど', 'g': 'ぐ',
-        'b': 'ぶ', 'p': 'ぷ', 's': 'す', 't': 'と', 'y': 'い', 'w': 'う',
-    }
-    
     result = []
     text_lower = text.lower()
     i = 0
@@ -96,8 +101,8 @@ def romaji_to_hiragana(text: str) -> str:
         for length in [4, 3, 2, 1]:
             if i + length <= len(text_lower):
                 substr = text_lower[i:i+length]
-                if substr in romaji_map:
-                    result.append(romaji_map[substr])
+                if substr in _ROMAJI_MAP:
+                    result.append(_ROMAJI_MAP[substr])
                     i += length
                     matched = True
                     break
@@ -210,6 +215,19 @@ def title_to_kana(title: str, use_ai: bool = False, api_key: str = None) -> str:
         if ai_result:  # AI変換が成功した場合
             return ai_result
     
+    return _title_to_kana_local(title)
+
+@lru_cache(maxsize=4096)
+def _title_to_kana_local(title: str) -> str:
+    """
+    AIを使わずにタイトルをひらがなに変換（同じタイトルの変換結果はキャッシュする）
+    
+    Args:
+        title: 元のタイトル（空文字以外）
+    
+    Returns:
+        ひらがなに変換された文字列
+    """
     # Unicode正規化（全角・半角を統一）
     normalized = unicodedata.normalize("NFKC", title.strip())
     
@@ -219,14 +237,14 @@ def title_to_kana(title: str, use_ai: bool = False, api_key: str = None) -> str:
         return romaji_to_hiragana(romaji_text)
     
     # 英字部分をひらがなに変換
-    normalized = re.sub(r'[a-zA-Z]+', replace_romaji, normalized)
+    normalized = _LATIN_RE.sub(replace_romaji, normalized)
     
     # pykakasiで残りの漢字・カタカナ→ひらがなに変換
     converter = get_kakasi()
     if converter is None:
         # pykakasiが使えない場合は変換済みの文字列を返す
         # スペースや記号を除去
-        result = re.sub(r'[^\u3040-\u309F]', '', normalized)
+        result = _NON_HIRAGANA_RE.sub('', normalized)
         return result.strip().lower()
     
     try:
@@ -235,11 +253,11 @@ def title_to_kana(title: str, use_ai: bool = False, api_key: str = None) -> str:
         # 各要素の'hira'（ひらがな）を結合
         kana = "".join([item.get('hira', item.get('orig', '')) for item in result])
         # スペースや記号を除去（ひらがなのみ残す）
-        kana = re.sub(r'[^\u3040-\u309F]', '', kana)
+        kana = _NON_HIRAGANA_RE.sub('', kana)
         return kana.strip()
     except Exception as e:
         # エラー時は変換済みの文字列を返す
         print(f"かな変換エラー: {e}")
         # スペースや記号を除去
-        result = re.sub(r'[^\u3040-\u309F]', '', normalized)
+        result = _NON_HIRAGANA_RE.sub('', normalized)
         return result.strip().lower()
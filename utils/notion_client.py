@@ -1,32 +1,101 @@
 import requests
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 """
 軽量なNotion APIユーティリティ
 - query_notion(db_id, api_key=..., filter=..., page_size=..., sorts=...)
+- iter_query_notion(db_id, api_key=..., ...)  # ページ単位で結果を返すジェネレータ
+  （filter_properties=[プロパティ名, ...] で取得するプロパティを絞り込める）
 - create_notion_page(db_id, properties, api_key=...)
 
 このモジュールはAPIキーを引数で受け取ることができ、ストリームリットのsecretsや環境変数と併用できます。
 """
 
 
+# 全リクエストで共有するHTTPセッション（Keep-AliveでTCP/TLS接続を再利用する）
+# APIキーに依存しない共通ヘッダーはセッションに一度だけ設定する
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Notion-Version": "2022-06-28",
+})
+
+# レート制限（429）と一時的な停止（503）はバックオフして再試行する。
+# どちらもNotion側で処理されていないため、POST/PATCHでも重複作成にならない。
+# 送信後の読み取りエラーなどはNotion側で処理済みの可能性があるため再試行しない
+# （接続確立前の失敗は未送信なので再試行してよい）。
+_RETRY = Retry(
+    total=3,
+    status=3,
+    read=0,
+    other=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset({"GET", "POST", "PATCH"}),
+    raise_on_status=False,
+)
+# 並行取得・削除（最大10並列）と一覧の先読みが重なっても接続を破棄しないよう、プールに余裕を持たせる
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY))
+
+
+@lru_cache(maxsize=8)
 def _build_headers(api_key: str) -> Dict[str, str]:
-    return {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28",
-    }
+    # リクエストごとに辞書を作り直さないよう、APIキーごとに使い回す（呼び出し側で変更しないこと）
+    return {"Authorization": f"Bearer {api_key}"}
 
 
-def query_notion(
+def _query_page(url: str, api_key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    res = _SESSION.post(url, headers=_build_headers(api_key), json=payload)
+    res.raise_for_status()
+    return res.json()
+
+
+@lru_cache(maxsize=16)
+def _database_property_ids(db_id: str, api_key: str) -> Dict[str, str]:
+    """データベースのプロパティ名→プロパティIDの対応を取得する（プロセス内でキャッシュ）。"""
+    url = f"https://api.notion.com/v1/databases/{db_id}"
+    res = _SESSION.get(url, headers=_build_headers(api_key))
+    res.raise_for_status()
+    return {name: prop["id"] for name, prop in res.json().get("properties", {}).items()}
+
+
+def _filter_properties_query(db_id: str, api_key: str, names: Sequence[str]) -> str:
+    """`filter_properties`のクエリ文字列を生成する。
+
+    プロパティIDはAPIからURLエンコード済みの形で返るため、そのまま連結する。
+    スキーマを取得できない場合は空文字（全プロパティを取得）を返す。
+    """
+    try:
+        ids = _database_property_ids(db_id, api_key)
+    except Exception as e:
+        print(f"Warning: Failed to retrieve database properties for {db_id}: {e}")
+        return ""
+    return "&".join(f"filter_properties={ids[name]}" for name in names if name in ids)
+
+
+def iter_query_notion(
     db_id: str,
     api_key: str,
     filter: Optional[Dict[str, Any]] = None,
     page_size: int = 100,
     sorts: Optional[List[Dict[str, Any]]] = None,
-) -> List[Dict[str, Any]]:
-    """Notionデータベースをクエリして`results`配列を返す。例外は呼び出し元で処理する。"""
+    filter_properties: Optional[Sequence[str]] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Notionデータベースをクエリし、ページ単位（最大page_size件）の`results`を順に返す。
+
+    `has_more`の間は`next_cursor`で次ページを取得する。呼び出し元が現在のページを
+    処理している間に、次ページのリクエストをバックグラウンドで先行して発行する。
+    `filter_properties`を指定すると、各ページにはそのプロパティのみが含まれる。
+    """
     url = f"https://api.notion.com/v1/databases/{db_id}/query"
+    if filter_properties:
+        query = _filter_properties_query(db_id, api_key, filter_properties)
+        if query:
+            url = f"{url}?{query}"
     payload: Dict[str, Any] = {}
     if filter:
         payload["filter"] = filter
@@ -35,16 +104,43 @@ def query_notion(
     if sorts:
         payload["sorts"] = sorts
 
-    res = requests.post(url, headers=_build_headers(api_key), json=payload)
-    res.raise_for_status()
-    return res.json().get("results", [])
+    data = _query_page(url, api_key, payload)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        while True:
+            next_future = None
+            if data.get("has_more") and data.get("next_cursor"):
+                next_payload = {**payload, "start_cursor": data["next_cursor"]}
+                next_future = executor.submit(_query_page, url, api_key, next_payload)
+
+            yield data.get("results", [])
+
+            if next_future is None:
+                break
+            data = next_future.result()
+
+
+def query_notion(
+    db_id: str,
+    api_key: str,
+    filter: Optional[Dict[str, Any]] = None,
+    page_size: int = 100,
+    sorts: Optional[List[Dict[str, Any]]] = None,
+    filter_properties: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Notionデータベースをクエリして全ページ分の`results`配列を返す。例外は呼び出し元で処理する。"""
+    results: List[Dict[str, Any]] = []
+    for batch in iter_query_notion(
+        db_id, api_key, filter=filter, page_size=page_size, sorts=sorts, filter_properties=filter_properties
+    ):
+        results.extend(batch)
+    return results
 
 
 def create_notion_page(db_id: str, properties: Dict[str, Any], api_key: str) -> Dict[str, Any]:
     """Notionに新しいページ（データベースの行）を作成してレスポンスJSONを返す。"""
     url = "https://api.notion.com/v1/pages"
     payload = {"parent": {"database_id": db_id}, "properties": properties}
-    res = requests.post(url, headers=_build_headers(api_key), json=payload)
+    res = _SESSION.post(url, headers=_build_headers(api_key), json=payload)
     
     # エラーの詳細情報を含めてエラーハンドリング
     if not res.ok:
@@ -62,7 +158,7 @@ def update_notion_page(page_id: str, properties: Dict[str, Any], api_key: str) -
     """既存ページのプロパティ更新を行う。"""
     url = f"https://api.notion.com/v1/pages/{page_id}"
     payload = {"properties": properties}
-    res = requests.patch(url, headers=_build_headers(api_key), json=payload)
+    res = _SESSION.patch(url, headers=_build_headers(api_key), json=payload)
     res.raise_for_status()
     return res.json()
 
@@ -70,7 +166,7 @@ def update_notion_page(page_id: str, properties: Dict[str, Any], api_key: str) -
 def retrieve_notion_page(page_id: str, api_key: str) -> Dict[str, Any]:
     """ページ単体を取得するラッパー。"""
     url = f"https://api.notion.com/v1/pages/{page_id}"
-    res = requests.get(url, headers=_build_headers(api_key))
+    res = _SESSION.get(url, headers=_build_headers(api_key))
     res.raise_for_status()
     return res.json()
 
@@ -79,6 +175,6 @@ def delete_notion_page(page_id: str, api_key: str) -> Dict[str, Any]:
     """Notionページをアーカイブ（削除）する。"""
     url = f"https://api.notion.com/v1/pages/{page_id}"
     payload = {"archived": True}
-    res = requests.patch(url, headers=_build_headers(api_key), json=payload)
+    res = _SESSION.patch(url, headers=_build_headers(api_key), json=payload)
     res.raise_for_status()
     return res.json()
@@ -0,0 +1,30 @@
+"""
+ワーカースレッドへのStreamlit実行コンテキストの引き継ぎ
+"""
+import threading
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+def submit_with_script_context(executor, fn, *args):
+    """
+    呼び出し元のScriptRunContextを引き継いで、スレッドプールで関数を実行する
+    
+    st.cache_data などStreamlitの機能を使う関数をワーカースレッドで実行すると
+    コンテキストがないため警告が出る。実行直前にワーカースレッドへ付与しておく
+    （プールのスレッドは使い回されるため、タスクごとに付け直す）。
+    
+    Args:
+        executor (ThreadPoolExecutor): 実行に使うスレッドプール
+        fn (callable): 実行する関数
+        *args: fn に渡す引数
+    
+    Returns:
+        Future: fn の結果を返すFuture
+    """
+    ctx = get_script_run_ctx()
+    
+    def _run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+    
+    return executor.submit(_run)
@@ -1,45 +1,47 @@
 """セッション状態管理"""
+import time
+import uuid
 import streamlit as st
 from typing import Optional, Any
 
+# セッション状態の初期値（キー, 初期値を生成する関数）
+# 辞書などのミュータブルな値はセッションごとに新しく生成する
+_DEFAULTS = (
+    ("page", lambda: "books_home"),
+    ("selected_book", lambda: None),
+    ("books_cache", lambda: None),
+    ("books_cache_ts", lambda: 0.0),
+    ("books_cache_epoch", lambda: -1),
+    ("special_volumes_cache", lambda: None),
+    ("special_volumes_cache_epoch", lambda: -1),
+    ("special_volumes_count_cache", dict),
+    ("registration_success", lambda: False),
+    ("update_success", lambda: False),
+    # 検索条件
+    ("search_filters", lambda: {
+        "title": "",
+        "magazine_type": "すべて",
+        "magazine_name": ""
+    }),
+    # スクロール制御フラグ
+    ("should_scroll_to_top", lambda: False),
+)
+
 class SessionManager:
     """セッション状態を管理するクラス"""
     
     @staticmethod
     def initialize():
-        """セッション状態を初期化"""
-        if "page" not in st.session_state:
-            st.session_state.page = "books_home"
-        
-        if "selected_book" not in st.session_state:
-            st.session_state.selected_book = None
-        
-        if "special_volumes_cache" not in st.session_state:
-            st.session_state.special_volumes_cache = None
-        
-        if "special_volumes_count_cache" not in st.session_state:
-            st.session_state.special_volumes_count_cache = {}
+        """セッション状態を初期化（セッションごとに一度だけ実行）"""
+        state = st.session_state
+        if state.get("_initialized"):
+            return
         
-        # magazine_type_expanded は使用しないため削除
-        # タブメニュー方式では展開状態の管理が不要
+        for key, factory in _DEFAULTS:
+            if key not in state:
+                state[key] = factory()
         
-        if "registration_success" not in st.session_state:
-            st.session_state.registration_success = False
-        
-        if "update_success" not in st.session_state:
-            st.session_state.update_success = False
-        
-        # 検索条件の初期化
-        if "search_filters" not in st.session_state:
-            st.session_state.search_filters = {
-                "title": "",
-                "magazine_type": "すべて",
-                "magazine_name": ""
-            }
-        
-        # スクロール制御フラグ
-        if "should_scroll_to_top" not in st.session_state:
-            st.session_state.should_scroll_to_top = False
+        state["_initialized"] = True
     
     @staticmethod
     def set_page(page_name: str):
@@ -107,14 +109,49 @@ class SessionManager:
             del st.session_state["selected_special_volume"]
     
     @staticmethod
-    def get_special_volumes_cache():
-        """特殊巻キャッシュを取得"""
+    def get_books_cache(max_age: float, epoch: int):
+        """漫画一覧キャッシュを取得
+        
+        Args:
+            max_age: キャッシュの有効秒数
+            epoch: 現在の一覧データの世代番号
+        
+        Returns:
+            漫画一覧、またはキャッシュがない・古い・世代が異なる場合は None
+        """
+        state = st.session_state
+        if state.get("books_cache_epoch") != epoch:
+            return None
+        if time.time() - state.get("books_cache_ts", 0.0) >= max_age:
+            return None
+        return state.get("books_cache")
+    
+    @staticmethod
+    def set_books_cache(mangas, epoch: int):
+        """漫画一覧キャッシュを設定"""
+        st.session_state.books_cache = mangas
+        st.session_state.books_cache_ts = time.time()
+        st.session_state.books_cache_epoch = epoch
+    
+    @staticmethod
+    def get_special_volumes_cache(epoch: int):
+        """特殊巻キャッシュを取得
+        
+        Args:
+            epoch: 現在の特殊巻一覧データの世代番号
+        
+        Returns:
+            book_id別の特殊巻一覧、またはキャッシュがない・世代が異なる場合は None
+        """
+        if st.session_state.get("special_volumes_cache_epoch") != epoch:
+            return None
         return st.session_state.get("special_volumes_cache")
     
     @staticmethod
-    def set_special_volumes_cache(special_volumes_data):
+    def set_special_volumes_cache(special_volumes_data, epoch: int):
         """特殊巻キャッシュを設定"""
         st.session_state.special_volumes_cache = special_volumes_data
+        st.session_state.special_volumes_cache_epoch = epoch
         
         # book_id別の特殊巻数もキャッシュ
         count_cache = {}
@@ -123,8 +160,10 @@ class SessionManager:
         st.session_state.special_volumes_count_cache = count_cache
     
     @staticmethod
-    def get_special_volume_count_for_book(book_id: str) -> int:
-        """指定された本IDの特殊巻数をキャッシュから取得"""
+    def get_special_volume_count_for_book(book_id: str, epoch: int) -> Optional[int]:
+        """指定された本IDの特殊巻数をキャッシュから取得（キャッシュがない・世代が異なる場合は None）"""
+        if SessionManager.get_special_volumes_cache(epoch) is None:
+            return None
         return st.session_state.special_volumes_count_cache.get(book_id, 0)
     
     @staticmethod
@@ -133,6 +172,26 @@ class SessionManager:
         st.session_state.special_volumes_cache = None
         st.session_state.special_volumes_count_cache = {}
     
+    @staticmethod
+    def get_upload_token(form_name: str) -> str:
+        """画像アップロード用の送信トークンを取得（フォームごと、保存成功まで同じ値を返す）
+        
+        Args:
+            form_name: フォーム名 (add_book, edit_book, add_special_volume)
+        
+        Returns:
+            str: 送信トークン
+        """
+        key = f"upload_token_{form_name}"
+        if key not in st.session_state:
+            st.session_state[key] = uuid.uuid4().hex[:12]
+        return st.session_state[key]
+    
+    @staticmethod
+    def reset_upload_token(form_name: str):
+        """送信トークンを破棄（保存成功後に呼び出し、次の送信では別のトークンを使う）"""
+        st.session_state.pop(f"upload_token_{form_name}", None)
+    
     # タブメニュー方式では以下のメソッドは不要
     # @staticmethod
     # def toggle_magazine_type(magazine_type: str):
@@ -217,16 +276,20 @@ class SessionManager:
     def go_to_add_book():
         """新規登録画面に遷移"""
         SessionManager.set_page("add_book")
+        # 画面を開き直したら新しい送信として扱う（別の作品と画像アセットを共有しないため）
+        SessionManager.reset_upload_token("add_book")
     
     @staticmethod
     def go_to_edit_book():
         """編集画面に遷移"""
         SessionManager.set_page("edit_book")
+        SessionManager.reset_upload_token("edit_book")
     
     @staticmethod
     def go_to_add_special_volume():
         """特殊巻登録画面に遷移"""
         SessionManager.set_page("add_special_volume")
+        SessionManager.reset_upload_token("add_special_volume")
         SessionManager.set_scroll_to_top(True)
     
     @staticmethod
@@ -0,0 +1,145 @@
+"""
+Notion取得結果のディスクスナップショット
+サーバー再起動直後などメモリキャッシュが空の場合でも、前回の取得結果を即座に返し、
+最新データの取得はバックグラウンドで行う（stale-while-revalidate）
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+# スナップショットの保存先
+SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".streamlit_books_cache")
+
+# この秒数より古いスナップショットは返却後にバックグラウンドで再取得する
+SNAPSHOT_REVALIDATE_AFTER = 60
+
+_lock = threading.Lock()
+_refreshing = set()
+# スナップショット削除ごとに進む世代番号（削除前に開始した再取得の書き込みを捨てるため）
+_generations = {}
+
+def _snapshot_path(name):
+    return os.path.join(SNAPSHOT_DIR, f"{name}.json")
+
+def load_snapshot(name):
+    """
+    スナップショットを読み込む
+    
+    Args:
+        name (str): スナップショット名
+    
+    Returns:
+        tuple or None: (ページ一覧, 経過秒数)、存在しないか読み込めない場合はNone
+    """
+    path = _snapshot_path(name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            pages = json.load(f)
+        return pages, time.time() - os.path.getmtime(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Warning: Failed to load snapshot {name}: {e}")
+        return None
+
+def save_snapshot(name, pages):
+    """
+    スナップショットを書き込む（一時ファイルに書いてから置き換える）
+    
+    Args:
+        name (str): スナップショット名
+        pages (list): Notion APIのページ一覧
+    """
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=SNAPSHOT_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(pages, f, ensure_ascii=False)
+        os.replace(tmp_path, _snapshot_path(name))
+    except Exception as e:
+        print(f"Warning: Failed to save snapshot {name}: {e}")
+
+def current_generation(name):
+    """
+    スナップショットの現在の世代番号を取得する（取得開始前に控えておき、保存時に照合する）
+    
+    Args:
+        name (str): スナップショット名
+    
+    Returns:
+        int: 世代番号
+    """
+    with _lock:
+        return _generations.get(name, 0)
+
+def save_snapshot_if_current(name, pages, generation):
+    """
+    取得開始後にスナップショットが削除されていない場合のみ書き込む
+    
+    世代の確認と書き込みを同じロック内で行い、取得中に他のセッションで
+    データが更新された場合は、更新前の内容で書き戻さない
+    
+    Args:
+        name (str): スナップショット名
+        pages (list): Notion APIのページ一覧
+        generation (int): 取得開始前に current_generation で控えた世代番号
+    
+    Returns:
+        bool: 書き込んだ場合はTrue
+    """
+    with _lock:
+        if _generations.get(name, 0) != generation:
+            return False
+        save_snapshot(name, pages)
+        return True
+
+def delete_snapshot(name):
+    """
+    スナップショットを削除する（データ更新後、古い内容を返さないようにするため）
+    
+    Args:
+        name (str): スナップショット名
+    """
+    with _lock:
+        _generations[name] = _generations.get(name, 0) + 1
+    try:
+        os.remove(_snapshot_path(name))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Failed to delete snapshot {name}: {e}")
+
+def refresh_snapshot_in_background(name, fetch_pages, on_refresh=None):
+    """
+    バックグラウンドで最新データを取得してスナップショットを更新する
+    
+    同じスナップショットの再取得が実行中の場合は何もしない。
+    取得に失敗した場合は既存のスナップショットをそのまま使い続ける。
+    
+    Args:
+        name (str): スナップショット名
+        fetch_pages (callable): Notionからページ一覧を取得する関数
+        on_refresh (callable): 更新後に呼び出す関数（メモリキャッシュの破棄など）
+    """
+    with _lock:
+        if name in _refreshing:
+            return
+        _refreshing.add(name)
+        generation = _generations.get(name, 0)
+    
+    def _refresh():
+        try:
+            pages = fetch_pages()
+            if not save_snapshot_if_current(name, pages, generation):
+                return
+            if on_refresh:
+                on_refresh()
+        except Exception as e:
+            print(f"Warning: Failed to refresh snapshot {name}, keeping stale data: {e}")
+        finally:
+            with _lock:
+                _refreshing.discard(name)
+    
+    threading.Thread(target=_refresh, name=f"snapshot-refresh-{name}", daemon=True).start()
@@ -3,26 +3,55 @@ Add Page: New manga registration form
 """
 
 import streamlit as st
-import datetime
+from typing import Callable, Optional
 from utils.config import Config
 from utils.kana_converter import title_to_kana
 from utils.notion_client import create_notion_page
+from utils.session import SessionManager
 from services.manga_service import MangaService
 from services.image_service import ImageService
 from components.book_form import BookFormFields
 from models.manga import Manga
 
 
+def _open_registered_book(load_manga: Callable[[], Optional[Manga]]):
+    """
+    登録した作品の詳細画面に遷移（取得できない場合はエラーを表示）
+    
+    Args:
+        load_manga: 登録した作品のMangaオブジェクトを返す関数
+    """
+    with st.spinner("作品詳細を読み込み中..."):
+        try:
+            registered_manga = load_manga()
+        except Exception as e:
+            st.error(f"❌ 作品詳細の取得でエラーが発生しました: {str(e)}")
+            st.info("📚 ホームページに戻って作品一覧を確認してください")
+            return
+    
+    if registered_manga is None:
+        st.error("❌ 登録された作品の詳細を取得できませんでした")
+        return
+    
+    SessionManager.go_to_detail(registered_manga)
+    st.rerun()
+
+
+@st.fragment
 def show_add_book(
     manga_service: MangaService,
     image_service: ImageService,
     go_to_home: callable,
     notion_api_key: str,
     books_database_id: str,
-    cloudinary_available: bool,
     cloudinary_enabled: bool
 ):
-    """新規漫画登録画面"""
+    """
+    新規漫画登録画面
+    
+    フラグメントとして実行されるため、画面内の操作では
+    この画面のみが再実行される（画面遷移時はst.rerun()でアプリ全体を再実行）
+    """
     st.header("➕ 新しい漫画を登録")
     
     # 戻るボタン
@@ -59,7 +88,7 @@ def show_add_book(
         
         # Cloudinaryが利用可能かチェック（プレビュー後のメッセージ）
         if uploaded_file is not None:
-            if cloudinary_enabled and cloudinary_available:
+            if cloudinary_enabled:
                 st.info("📤 登録時にCloudinaryにアップロードされます")
             else:
                 st.warning("⚠️ Cloudinary設定が見つかりません。画像URLは保存されません。")
@@ -87,13 +116,14 @@ def show_add_book(
                 st.error("❌ 所持巻数が発売済み最新巻を超えています")
             else:
                 try:
-                    # ImageServiceを使用して画像アップロード
+                    # ImageServiceを使用して画像アップロード（かな生成と並行して実行）
                     final_image_url = None
+                    upload_future = None
                     
                     if uploaded_file is not None and image_service.is_available():
-                        with st.spinner("画像をアップロード中..."):
-                            final_image_url = image_service.upload_image(uploaded_file)
-                            st.success(f"✅ 画像アップロード完了: {uploaded_file.name}")
+                        upload_future = image_service.start_upload(
+                            uploaded_file, SessionManager.get_upload_token("add_book")
+                        )
                     elif uploaded_file is not None:
                         st.warning("⚠️ Cloudinary設定がないため、画像はアップロードされませんでした")
                     
@@ -109,6 +139,12 @@ def show_add_book(
                         with st.spinner("タイトルかなを生成中..." + (" (AI使用)" if use_ai else "")):
                             final_title_kana = title_to_kana(title, use_ai=use_ai, api_key=openai_api_key)
                     
+                    # アップロード完了を待ってURLを取得
+                    if upload_future is not None:
+                        with st.spinner("画像をアップロード中..."):
+                            final_image_url = upload_future.result()
+                        st.success(f"✅ 画像アップロード完了: {uploaded_file.name}")
+                    
                     # Mangaオブジェクトを作成
                     # リレーション情報の準備（新規作成時は親作品のみ）
                     related_books_to = [parent_id] if parent_id else None
@@ -139,6 +175,9 @@ def show_add_book(
                         with st.spinner("Notionに登録中..."):
                             result_id = manga_service.create_manga(new_manga)
                             
+                            # 詳細画面用の作品データ取得を、親作品のリレーション更新と並行して開始
+                            registered_future = manga_service.start_fetch(result_id)
+                            
                             # リレーション設定後の相互更新処理（親作品の場合のみ）
                             if parent_id:
                                 with st.spinner("シリーズ関係を更新中..."):
@@ -148,38 +187,24 @@ def show_add_book(
                                         new_parent_id=parent_id
                                     )
                         
+                        # 次の登録では別の画像アセットを使うよう送信トークンを破棄
+                        SessionManager.reset_upload_token("add_book")
+                        
                         # 特殊巻キャッシュをクリア（新規作品が追加されたため）
-                        from utils.session import SessionManager
                         SessionManager.clear_special_volumes_cache()
                         
-                        st.success("✅ 漫画が正常に登録されました！")
-                        st.balloons()
-                        
-                        # 画像URLがある場合は表示
-                        if final_image_url:
-                            st.markdown(f"🔗 [画像を開く]({final_image_url})")
+                        # 直後に詳細画面へ遷移するため、通知は再実行後も残るトーストで表示
+                        st.toast("漫画が正常に登録されました！", icon="✅")
                         
                         # かなが自動生成された場合は通知（AI生成の場合は明示）
                         if not title_kana.strip() and final_title_kana:
                             if ai_generated:
-                                st.info(f"🤖 タイトルかなをAIで生成しました: **{final_title_kana}** (AI生成)")
+                                st.toast(f"タイトルかなをAIで生成しました: {final_title_kana} (AI生成)", icon="🤖")
                             else:
-                                st.info(f"💡 タイトルかなを自動生成しました: {final_title_kana}")
+                                st.toast(f"タイトルかなを自動生成しました: {final_title_kana}", icon="💡")
                         
-                        # 登録完了後、直接詳細画面に遷移
-                        with st.spinner("作品詳細を読み込み中..."):
-                            try:
-                                # 登録した作品の詳細データを取得
-                                registered_manga = manga_service.get_manga_by_id(result_id)
-                                if registered_manga:
-                                    st.session_state.selected_book = registered_manga.to_dict()
-                                    st.session_state.page = "book_detail"
-                                    st.rerun()
-                                else:
-                                    st.error("❌ 登録された作品の詳細を取得できませんでした")
-                            except Exception as e:
-                                st.error(f"❌ 作品詳細の取得でエラーが発生しました: {str(e)}")
-                                st.info("📚 ホームページに戻って作品一覧を確認してください")
+                        # 登録完了後、直接詳細画面に遷移（取得はリレーション更新中に開始済み）
+                        _open_registered_book(registered_future.result)
                         
                     except Exception as full_error:
                         st.error(f"❌ 登録に失敗しました: {str(full_error)}")
@@ -198,24 +223,15 @@ def show_add_book(
                         try:
                             with st.spinner("基本プロパティで登録中..."):
                                 result = create_notion_page(books_database_id, minimal_properties, notion_api_key)
+                                manga_service.clear_cache()
+                            SessionManager.reset_upload_token("add_book")
                             
-                            st.success("✅ 基本プロパティで登録成功！")
-                            st.info("💡 基本情報のみ保存されました。詳細情報は後で編集してください。")
+                            st.toast("基本プロパティで登録成功！", icon="✅")
+                            st.toast("基本情報のみ保存されました。詳細情報は後で編集してください。", icon="💡")
                             
                             # 登録完了後、直接詳細画面に遷移
-                            with st.spinner("作品詳細を読み込み中..."):
-                                try:
-                                    # 登録した作品の詳細データを取得
-                                    registered_manga = manga_service.get_manga_by_id(result["id"])
-                                    if registered_manga:
-                                        st.session_state.selected_book = registered_manga.to_dict()
-                                        st.session_state.page = "book_detail"
-                                        st.rerun()
-                                    else:
-                                        st.error("❌ 登録された作品の詳細を取得できませんでした")
-                                except Exception as e:
-                                    st.error(f"❌ 作品詳細の取得でエラーが発生しました: {str(e)}")
-                                    st.info("📚 ホームページに戻って作品一覧を確認してください")
+                            # （作成APIのレスポンスは作成したページそのものなので、再取得せずに変換する）
+                            _open_registered_book(lambda: Manga.from_notion_page(result))
                             
                         except Exception as minimal_error:
                             st.error(f"❌ 基本プロパティでも登録失敗: {str(minimal_error)}")
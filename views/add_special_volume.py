@@ -72,7 +72,9 @@ def show_add_special_volume(
                     
                     if uploaded_file is not None and image_service.is_available():
                         with st.spinner("画像をアップロード中..."):
-                            final_image_url = image_service.upload_image(uploaded_file)
+                            final_image_url = image_service.upload_image(
+                                uploaded_file, SessionManager.get_upload_token("add_special_volume")
+                            )
                             st.success(f"✅ 画像アップロード完了: {uploaded_file.name}")
                     elif uploaded_file is not None:
                         st.warning("⚠️ Cloudinary設定がないため、画像はアップロードされませんでした")
@@ -94,6 +96,9 @@ def show_add_special_volume(
                         result_id = special_volume_service.create_special_volume(new_special_volume)
                     
                     if result_id:
+                        # 次の登録では別の画像アセットを使うよう送信トークンを破棄
+                        SessionManager.reset_upload_token("add_special_volume")
+                        
                         # キャッシュをクリア
                         SessionManager.clear_special_volumes_cache()
                         
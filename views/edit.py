@@ -6,20 +6,26 @@ import streamlit as st
 import datetime
 from utils.config import Config
 from utils.kana_converter import title_to_kana
+from utils.session import SessionManager
 from services.manga_service import MangaService
 from services.image_service import ImageService
 from components.book_form import BookFormFields
 from models.manga import Manga
 
 
+@st.fragment
 def show_edit_book(
     manga_service: MangaService,
     image_service: ImageService,
     go_to_home: callable,
-    cloudinary_available: bool,
     cloudinary_enabled: bool
 ):
-    """漫画編集画面"""
+    """
+    漫画編集画面
+    
+    フラグメントとして実行されるため、画面内の操作では
+    この画面のみが再実行される（画面遷移時はst.rerun()でアプリ全体を再実行）
+    """
     st.header("✏️ 漫画情報を編集")
     
     # 戻るボタン
@@ -114,7 +120,7 @@ def show_edit_book(
         )
         
         if uploaded_file is not None:
-            if cloudinary_enabled and cloudinary_available:
+            if cloudinary_enabled:
                 st.info("📤 保存時にCloudinaryにアップロードされ、現在の画像と入れ替わります")
             else:
                 st.warning("⚠️ Cloudinary設定が見つかりません")
@@ -150,13 +156,14 @@ def show_edit_book(
                 st.error("❌ 所持巻数が発売済み最新巻を超えています")
             else:
                 try:
-                    # ImageServiceを使用して画像を置き換え
+                    # ImageServiceを使用して画像を置き換え（かな生成と並行して実行）
                     final_image_url = current_image_url
+                    replace_future = None
                     
                     if uploaded_file is not None and image_service.is_available():
-                        with st.spinner("画像をアップロード中..."):
-                            final_image_url = image_service.replace_image(current_image_url, uploaded_file)
-                            st.success(f"✅ 画像アップロード完了: {uploaded_file.name}")
+                        replace_future = image_service.start_replace(
+                            current_image_url, uploaded_file, SessionManager.get_upload_token("edit_book")
+                        )
                     elif uploaded_file is not None:
                         st.warning("⚠️ Cloudinary設定がないため、画像はアップロードされませんでした")
                     
@@ -172,6 +179,12 @@ def show_edit_book(
                         with st.spinner("タイトルかなを生成中..." + (" (AI使用)" if use_ai else "")):
                             final_title_kana = title_to_kana(title, use_ai=use_ai, api_key=openai_api_key)
                     
+                    # 置き換え完了を待ってURLを取得
+                    if replace_future is not None:
+                        with st.spinner("画像をアップロード中..."):
+                            final_image_url = replace_future.result()
+                        st.success(f"✅ 画像アップロード完了: {uploaded_file.name}")
+                    
                     # リレーション情報の準備
                     related_books_to = [parent_id] if parent_id else None
                     related_books_from = children_ids if children_ids else None
@@ -182,14 +195,14 @@ def show_edit_book(
                         if hasattr(latest_release_date, 'date'):
                             latest_release_date = latest_release_date.date()
                         elif isinstance(latest_release_date, str):
-                            latest_release_date = datetime.datetime.strptime(latest_release_date, "%Y-%m-%d").date()
+                            latest_release_date = datetime.date.fromisoformat(latest_release_date)
                         
                         # next_release_dateの型確認
                         if use_next_release_date and next_release_date:
                             if hasattr(next_release_date, 'date'):
                                 next_release_date = next_release_date.date()
                             elif isinstance(next_release_date, str):
-                                next_release_date = datetime.datetime.strptime(next_release_date, "%Y-%m-%d").date()
+                                next_release_date = datetime.date.fromisoformat(next_release_date)
                         else:
                             next_release_date = None
                             
@@ -233,7 +246,8 @@ def show_edit_book(
                             # プロパティ生成のテスト
                             try:
                                 test_properties = updated_manga.to_notion_properties()
-                                print(f"Generated properties for update: {test_properties}")
+                                if Config.is_debug_enabled():
+                                    print(f"Generated properties for update: {test_properties}")
                             except Exception as prop_error:
                                 st.error(f"❌ データ変換エラー: {str(prop_error)}")
                                 return
@@ -241,8 +255,10 @@ def show_edit_book(
                             success = manga_service.update_manga(updated_manga)
                             
                             if success:
+                                # 次の更新では別の画像アセットを使うよう送信トークンを破棄
+                                SessionManager.reset_upload_token("edit_book")
+                                
                                 # 特殊巻キャッシュをクリア（更新時にデータが変更される可能性があるため）
-                                from utils.session import SessionManager
                                 SessionManager.clear_special_volumes_cache()
                                 
                                 # リレーション変更時の相互更新処理（親作品の変更のみ）
@@ -302,7 +318,7 @@ def show_edit_book(
                 try:
                     book_id = getattr(book, 'id', None)
                     if book_id:
-                        updated_manga = manga_service.get_manga_by_id(book_id)
+                        updated_manga = manga_service.get_manga_by_id(book_id, fresh=True)
                         if updated_manga:
                             st.session_state.selected_book = updated_manga
                 except:
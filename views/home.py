@@ -4,14 +4,16 @@ Home Page: Book list display with grid layout
 
 import streamlit as st
 from services.manga_service import MangaService
-from services.image_service import ImageService
 from components.book_card import BookCard
 from components.book_form import BookFormFields
 from utils.session import SessionManager
-from config.constants import MAGAZINE_TYPE_ORDER
+from utils.grid import chunked
 from typing import List
 from models.manga import Manga
 
+# 一覧に一度に表示する作品数（「もっと見る」で追加表示）
+GRID_PAGE_SIZE = 30
+
 
 def calculate_volumes_breakdown(mangas: List[Manga], special_volume_service) -> dict:
     """漫画リストの冊数を詳細に分析（バッチ処理）
@@ -159,8 +161,7 @@ def show_books_home(
     st.header("📖 所持作品一覧")
     
     # 新規登録ボタン
-    st.markdown('<div class="add-book-button">', unsafe_allow_html=True)
-    col1, col2 = st.columns([1, 1])
+    col1, col2, col3 = st.columns([1, 1, 1])
     with col1:
         if st.button("➕ 新しい漫画を登録", type="primary"):
             st.session_state.page = "add_book"
@@ -169,24 +170,76 @@ def show_books_home(
         if st.button("📔 特殊巻を登録", type="secondary"):
             st.session_state.page = "add_special_volume"
             st.rerun()
-    st.markdown('</div>', unsafe_allow_html=True)
+    with col3:
+        # Notion側で直接編集した内容を反映させるため、キャッシュを破棄して再取得
+        if st.button("🔄 最新の情報に更新", help="Notionからデータを再読み込みします"):
+            manga_service.clear_cache()
+            if special_volume_service:
+                special_volume_service.clear_cache()
+            SessionManager.clear_special_volumes_cache()
+            st.rerun()
+    
+    _show_book_list(
+        manga_service=manga_service,
+        notion_api_key=notion_api_key,
+        books_database_id=books_database_id,
+        go_to_detail=go_to_detail,
+        special_volume_service=special_volume_service
+    )
+
+
+def _sorted_by_kana(mangas: List[Manga]) -> List[Manga]:
+    """
+    漫画一覧をtitle_kanaの五十音順に並べたリストを取得
     
+    同じ読みの作品はIDで並べ、再実行ごとにボタンの並びが変わらないようにする。
+    セッションキャッシュの一覧は再実行をまたいで同じオブジェクトのため、
+    同一オブジェクトであれば前回の並び替え結果を再利用する。
+    
+    Args:
+        mangas: 漫画オブジェクトのリスト（絞り込み前）
+    
+    Returns:
+        List[Manga]: 並び替え後の漫画リスト
+    """
+    state = st.session_state
+    if state.get("sorted_books_source") is not mangas:
+        state.sorted_books = sorted(mangas, key=lambda m: (m.title_kana or m.title or "", m.id))
+        state.sorted_books_source = mangas
+    return state.sorted_books
+
+
+def _show_more_books():
+    """一覧の表示件数を増やす（「もっと見る」ボタンのコールバック）"""
+    st.session_state.grid_limit += GRID_PAGE_SIZE
+
+
+@st.fragment
+def _show_book_list(
+    manga_service: MangaService,
+    notion_api_key: str,
+    books_database_id: str,
+    go_to_detail: callable,
+    special_volume_service=None
+):
+    """
+    検索フィルターと本の一覧グリッドを表示
+    
+    フラグメントとして実行されるため、フィルター操作時は
+    アプリ全体ではなくこの部分のみが再実行される
+    """
     # 検索フィルター
     with st.expander("🔍 検索・フィルター", expanded=False):
         search_filters = BookFormFields.render_search_filters()
     
-    # データベース接続を試行
-    mangas = []
+    # 特殊巻一覧の取得を漫画一覧の取得と並行して開始（冊数集計・詳細画面で使用）
+    special_volumes_prefetch = special_volume_service.start_prefetch() if special_volume_service else None
     
+    # データベース接続を試行（tryは通信部分のみに限定し、以降の処理の不具合を接続エラーとして扱わない）
     try:
         # MangaServiceを使用してデータを取得
-        with st.spinner("データを読み込み中..."):
-            mangas = manga_service.get_all_mangas()
-        
-        # データが取得できなかった場合
-        if not mangas:
-            st.info("💡 まだ漫画が登録されていません。「新しい漫画を登録」ボタンから追加してください。")
-        
+        # （スピナーはキャッシュがなくNotionへ問い合わせる場合のみ表示される）
+        mangas = manga_service.get_all_mangas()
     except Exception as e:
         error_message = str(e)
         if "401" in error_message or "Unauthorized" in error_message:
@@ -284,57 +337,78 @@ def show_books_home(
             st.warning(f"⚠️ NotionDBに接続できませんでした: {error_message}")
             st.info("📋 設定を確認してください。")
         
-        # エラー時は空のリストを設定
-        mangas = []
+        # 接続エラー時は一覧を描画しない
+        return
     
-    # 本の一覧表示（データがある場合のみ）
-    if mangas:
-        # 検索フィルターを適用
-        filtered_mangas = filter_mangas(mangas, search_filters)
+    # 先読みした特殊巻をセッションキャッシュに格納
+    if special_volumes_prefetch is not None:
+        special_volume_service.get_all_special_volumes_grouped_by_book(prefetch=special_volumes_prefetch)
+    
+    # データが取得できなかった場合
+    if not mangas:
+        st.info("💡 まだ漫画が登録されていません。「新しい漫画を登録」ボタンから追加してください。")
+        return
+    
+    # 並び替え済みの一覧に検索フィルターを適用（絞り込みは並び順を保つため、再ソートは不要）
+    filtered_mangas = filter_mangas(_sorted_by_kana(mangas), search_filters)
+    
+    if not filtered_mangas:
+        st.info("🔍 検索条件に一致する漫画が見つかりませんでした。")
+        return
+    
+    # 検索結果件数と合計冊数を表示（特殊巻の内訳を含む）
+    if any(search_filters.values()):
+        # フィルター結果の分析
+        filtered_breakdown = calculate_volumes_breakdown(filtered_mangas, special_volume_service)
+        # 全体の分析
+        all_breakdown = calculate_volumes_breakdown(mangas, special_volume_service)
         
-        if not filtered_mangas:
-            st.info("🔍 検索条件に一致する漫画が見つかりませんでした。")
-            return
+        # 表示形式: 10作品・50冊の漫画が見つかりました（50/94作品・50冊[12冊]/1670冊[30冊]）
+        filtered_total = filtered_breakdown['total_volumes']
+        filtered_special = filtered_breakdown['special_volumes']
+        all_total = all_breakdown['total_volumes']
+        all_special = all_breakdown['special_volumes']
         
-        # 検索結果件数と合計冊数を表示（特殊巻の内訳を含む）
-        if any(search_filters.values()):
-            # フィルター結果の分析
-            filtered_breakdown = calculate_volumes_breakdown(filtered_mangas, special_volume_service)
-            # 全体の分析
-            all_breakdown = calculate_volumes_breakdown(mangas, special_volume_service)
-            
-            # 表示形式: 10作品・50冊の漫画が見つかりました（50/94作品・50冊[12冊]/1670冊[30冊]）
-            filtered_total = filtered_breakdown['total_volumes']
-            filtered_special = filtered_breakdown['special_volumes']
-            all_total = all_breakdown['total_volumes']
-            all_special = all_breakdown['special_volumes']
-            
-            st.info(f"🎯 {len(filtered_mangas)}作品・{filtered_total}冊の漫画が見つかりました（{len(filtered_mangas)}/{len(mangas)}作品・{filtered_total}冊[{filtered_special}冊]/{all_total}冊[{all_special}冊]）")
-        else:
-            # 全件表示時も特殊巻の内訳を表示
-            breakdown = calculate_volumes_breakdown(mangas, special_volume_service)
-            total_volumes = breakdown['total_volumes']
-            special_volumes = breakdown['special_volumes']
-            st.info(f"📚 全{len(mangas)}作品・{total_volumes}冊の漫画を表示中（特殊巻{special_volumes}冊を含む）")
+        st.info(f"🎯 {len(filtered_mangas)}作品・{filtered_total}冊の漫画が見つかりました（{len(filtered_mangas)}/{len(mangas)}作品・{filtered_total}冊[{filtered_special}冊]/{all_total}冊[{all_special}冊]）")
+    else:
+        # 全件表示時も特殊巻の内訳を表示
+        breakdown = calculate_volumes_breakdown(mangas, special_volume_service)
+        total_volumes = breakdown['total_volumes']
+        special_volumes = breakdown['special_volumes']
+        st.info(f"📚 全{len(mangas)}作品・{total_volumes}冊の漫画を表示中（特殊巻{special_volumes}冊を含む）")
+    
+    # カードHTMLは一覧データ単位でキャッシュされ、再実行時は再生成しない
+    card_html = BookCard.render_all(mangas)
+    
+    # 表示件数を制限し、「もっと見る」で追加表示する（検索条件が変わったら先頭に戻す）
+    filter_signature = repr(sorted(search_filters.items()))
+    if st.session_state.get("grid_filter_signature") != filter_signature:
+        st.session_state.grid_filter_signature = filter_signature
+        st.session_state.grid_limit = GRID_PAGE_SIZE
+    grid_limit = st.session_state.grid_limit
+    
+    # PC表示：3カラムで表示
+    # スマホ表示：CSSで1カラムに変換
+    # 最初の行は表示直後に画面内にあるため、画像を遅延読み込みせず優先して取得する
+    for row_index, row_books in enumerate(chunked(filtered_mangas[:grid_limit], 3)):
+        cols = st.columns(3, gap="small")
         
-        # 全ての漫画をtitle_kanaの五十音順でソート
-        sorted_mangas = sorted(
-            filtered_mangas,
-            key=lambda m: m.title_kana or m.title or ""
+        for col, manga in zip(cols, row_books):
+            with col:
+                # BookCardコンポーネントで生成済みのHTMLを表示
+                html = card_html[manga.id]
+                st.markdown(BookCard.prioritize(html) if row_index == 0 else html, unsafe_allow_html=True)
+                
+                # 詳細ボタン
+                if st.button("詳細を見る", key=f"detail_{manga.id}", use_container_width=True):
+                    go_to_detail(manga)
+                    st.rerun()
+    
+    remaining = len(filtered_mangas) - grid_limit
+    if remaining > 0:
+        st.button(
+            f"もっと見る（残り{remaining}作品）",
+            key="grid_load_more",
+            on_click=_show_more_books,
+            use_container_width=True
         )
-        
-        # PC表示：3カラムで表示
-        # スマホ表示：CSSで1カラムに変換
-        for row_start in range(0, len(sorted_mangas), 3):
-            cols = st.columns(3, gap="small")
-            row_books = sorted_mangas[row_start:row_start + 3]
-            
-            for col_idx, manga in enumerate(row_books):
-                with cols[col_idx]:
-                    # BookCardコンポーネントでHTMLを生成
-                    st.markdown(BookCard.render(manga), unsafe_allow_html=True)
-                    
-                    # 詳細ボタン
-                    if st.button(f"詳細を見る", key=f"detail_{manga.id}", use_container_width=True):
-                        go_to_detail(manga)
-                        st.rerun()
@@ -3,7 +3,19 @@ Special Volume Detail Page: 特殊巻詳細画面
 """
 
 import streamlit as st
-from config.constants import DEFAULT_IMAGE_URL
+from config.constants import PLACEHOLDER_IMAGE_SVG
+from utils.grid import chunked
+from utils.image_url import detail_image_url
+from utils.session import SessionManager
+
+# タイプ別のバッジ（内容は固定のため事前に生成しておく。未定義のタイプは表示時に生成）
+_TYPE_BADGES = {
+    "特殊巻": '<span class="status-badge status-ongoing">📔 特殊巻</span>',
+    "外伝": '<span class="status-badge status-completed">📖 外伝</span>',
+    "ガイドブック": '<span class="status-badge status-ongoing">📋 ガイドブック</span>',
+    "映画": '<span class="status-badge status-completed">🎬 映画</span>',
+    "小説": '<span class="status-badge status-ongoing">📕 小説</span>',
+}
 
 
 def show_special_volume_detail(
@@ -11,8 +23,6 @@ def show_special_volume_detail(
     manga_service
 ):
     """特殊巻詳細画面：選択された特殊巻の詳細情報表示"""
-    from utils.session import SessionManager
-    
     # 選択された特殊巻の確認
     selected_special_volume = SessionManager.get_selected_special_volume()
     if selected_special_volume is None:
@@ -27,15 +37,12 @@ def show_special_volume_detail(
     
     # 親作品情報を取得
     try:
-        parent_manga = manga_service.get_manga_by_id(special_volume.book_id)
+        parent_manga = manga_service.find_manga_by_id(special_volume.book_id)
     except Exception as e:
         st.error(f"親作品情報の取得に失敗しました: {str(e)}")
         parent_manga = None
     
     # ボタン群を水平配置
-    st.markdown('<div class="detail-page-container">', unsafe_allow_html=True)
-    st.markdown('<div class="detail-buttons-container">', unsafe_allow_html=True)
-    
     # 3列レイアウト（戻る・空白・編集削除）
     home_col, spacer_col, action_col = st.columns([2, 1, 2])
     
@@ -56,17 +63,12 @@ def show_special_volume_detail(
                 # TODO: 特殊巻削除機能を後で実装
                 st.info("特殊巻削除機能は後で実装予定")
     
-    st.markdown('</div>', unsafe_allow_html=True)  # detail-buttons-container終了
-    
-    # メインコンテンツを中央配置
-    st.markdown('<div class="detail-content-container">', unsafe_allow_html=True)
-    
     # 画像と基本情報を横並び表示
     image_col, info_col = st.columns([1, 2])
     
     with image_col:
-        # 画像表示
-        image_url = special_volume.image_url if special_volume.image_url else DEFAULT_IMAGE_URL
+        # 画像表示（Cloudinary画像は表示サイズに合わせて縮小、画像なしの場合はインラインSVGのプレースホルダー）
+        image_url = detail_image_url(special_volume.image_url) if special_volume.image_url else PLACEHOLDER_IMAGE_SVG
         st.image(
             image_url,
             caption=special_volume.title,
@@ -75,31 +77,22 @@ def show_special_volume_detail(
         )
     
     with info_col:
-        # タイトル
-        st.markdown(f'<h1 class="book-title">{parent_manga.title} - {special_volume.title}</h1>', unsafe_allow_html=True)
-        
-        # 基本情報表示
-        st.markdown("### 📚 基本情報")
-        
         # タイプ（通常作品の連載状況のように表示）
         type_display = special_volume.type if special_volume.type else "特殊巻"
-        if type_display == "特殊巻":
-            type_badge = '<span class="status-badge status-ongoing">📔 特殊巻</span>'
-        elif type_display == "外伝":
-            type_badge = '<span class="status-badge status-completed">📖 外伝</span>'
-        elif type_display == "ガイドブック":
-            type_badge = '<span class="status-badge status-ongoing">📋 ガイドブック</span>'
-        elif type_display == "映画":
-            type_badge = '<span class="status-badge status-completed">🎬 映画</span>'
-        elif type_display == "小説":
-            type_badge = '<span class="status-badge status-ongoing">📕 小説</span>'
-        else:
+        type_badge = _TYPE_BADGES.get(type_display)
+        if type_badge is None:
             type_badge = f'<span class="status-badge status-ongoing">📔 {type_display}</span>'
         
-        st.markdown(type_badge, unsafe_allow_html=True)
+        # タイトル・基本情報見出し・タイプ・親作品ラベルを1回の描画にまとめて出力
+        st.markdown(
+            f'<h1 class="book-title">{parent_manga.title} - {special_volume.title}</h1>\n\n'
+            "### 📚 基本情報\n\n"
+            f"{type_badge}\n\n"
+            "**親作品:**",
+            unsafe_allow_html=True
+        )
         
         # 親作品情報
-        st.markdown("**親作品:**")
         if st.button(f"📖 {parent_manga.title}", key="parent_manga_link"):
             SessionManager.go_to_detail(parent_manga)
             st.rerun()
@@ -107,38 +100,26 @@ def show_special_volume_detail(
         # その他の特殊巻表示
         if parent_manga:
             try:
-                # 同じ親作品の他の特殊巻を取得
-                all_special_volumes = special_volume_service.get_special_volumes_by_book_id(parent_manga.id)
+                # 同じ親作品の他の特殊巻を取得（一覧のグループ化キャッシュを利用し、Notionへの問い合わせを省く）
+                grouped_data = special_volume_service.get_all_special_volumes_grouped_by_book()
+                all_special_volumes = grouped_data.get(parent_manga.id, [])
                 other_special_volumes = [sv for sv in all_special_volumes if sv.id != special_volume.id]
                 
                 if other_special_volumes:
-                    st.markdown("---")
-                    st.subheader("📔 その他の特殊巻")
+                    st.markdown("---\n\n### 📔 その他の特殊巻")
                     
                     # 特殊巻をソート（type昇順、sort_order昇順）
                     sorted_volumes = sorted(other_special_volumes, key=lambda x: (x.type or "", x.sort_order or 0))
                     
                     # 2列表示で他の特殊巻を表示
-                    for i in range(0, len(sorted_volumes), 2):
+                    for row_volumes in chunked(sorted_volumes, 2):
                         cols = st.columns(2)
                         
-                        with cols[0]:
-                            sv = sorted_volumes[i]
-                            if st.button(f"📔 {sv.title}", key=f"other_sv_{sv.id}_0"):
-                                SessionManager.go_to_special_volume_detail(sv)
-                                st.rerun()
-                        
-                        if i + 1 < len(sorted_volumes):
-                            with cols[1]:
-                                sv = sorted_volumes[i + 1]
-                                if st.button(f"📔 {sv.title}", key=f"other_sv_{sv.id}_1"):
+                        for col, sv in zip(cols, row_volumes):
+                            with col:
+                                if st.button(f"📔 {sv.title}", key=f"other_sv_{sv.id}"):
                                     SessionManager.go_to_special_volume_detail(sv)
                                     st.rerun()
             
             except Exception as e:
-                st.error(f"その他の特殊巻の取得に失敗しました: {str(e)}")
-    
-    st.markdown('</div>', unsafe_allow_html=True)  # detail-content-container終了
-    
-    # 詳細ページコンテナを閉じる
-    st.markdown('</div>', unsafe_allow_html=True)  # detail-page-container終了
\ No newline at end of file
+                st.error(f"その他の特殊巻の取得に失敗しました: {str(e)}")
\ No newline at end of file